@@ -1,39 +1,88 @@
+import functools
+import importlib
 import os
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from importlib.util import find_spec
 
+import anyio
 from fastmcp import FastMCP
 from lib_logger import LoggerCore
 from lib_logger.config import configure_logging_from_env
 
 configure_logging_from_env()
 
-from tools import (  # noqa: E402
-    addons,
-    debug,
-    groups,
-    invoice_places,
-    licenses,
-    phone_numbers,
-    queues,
-    templates,
-    users,
-)
+from utils import http_client, warm_up_client  # noqa: E402
 
 logger = LoggerCore.get_logger("onboarding-mcp")
 
-mcp = FastMCP("Onboarding MCP Server")
+ENABLED_TOOLS_VAR = "ONBOARDING_MCP_TOOLS"
+
+# (mount prefix, tools module) pairs. Modules are only imported when enabled.
+TOOL_MOUNTS = (
+    ("users", "tools.users"),
+    ("licenses", "tools.licenses"),
+    ("phone_numbers", "tools.phone_numbers"),
+    ("groups", "tools.groups"),
+    ("queues", "tools.queues"),
+    ("addons", "tools.addons"),
+    ("invoice_places", "tools.invoice_places"),
+    ("templates", "tools.templates"),
+    ("bootstrap", "tools.bootstrap"),
+    ("debug", "tools.debug"),
+)
+
+
+def get_enabled_prefixes() -> set[str] | None:
+    """Read the comma-separated tool prefixes to mount; None mounts everything."""
+    value = os.environ.get(ENABLED_TOOLS_VAR, "").strip()
+    if not value:
+        return None
+
+    enabled = {prefix.strip() for prefix in value.split(",") if prefix.strip()}
+    unknown = enabled - {prefix for prefix, _ in TOOL_MOUNTS}
+    if unknown:
+        logger.warning(
+            "Ignoring unknown tool modules in {var}: {unknown}",
+            var=ENABLED_TOOLS_VAR,
+            unknown=sorted(unknown),
+        )
+    return enabled
+
+
+@asynccontextmanager
+async def lifespan(server: FastMCP) -> AsyncIterator[None]:
+    await warm_up_client()
+    try:
+        yield
+    finally:
+        await http_client.aclose()
+        # Drain records still queued by adapters running with enqueue=True
+        await logger.complete()
+
+
+mcp = FastMCP("Onboarding MCP Server", lifespan=lifespan)
 
-mcp.mount(users.mcp, prefix="users")
-mcp.mount(licenses.mcp, prefix="licenses")
-mcp.mount(phone_numbers.mcp, prefix="phone_numbers")
-mcp.mount(groups.mcp, prefix="groups")
-mcp.mount(queues.mcp, prefix="queues")
-mcp.mount(addons.mcp, prefix="addons")
-mcp.mount(invoice_places.mcp, prefix="invoice_places")
-mcp.mount(templates.mcp, prefix="templates")
-mcp.mount(debug.mcp, prefix="debug")
+enabled_prefixes = get_enabled_prefixes()
+for prefix, module_name in TOOL_MOUNTS:
+    if enabled_prefixes is None or prefix in enabled_prefixes:
+        mcp.mount(importlib.import_module(module_name).mcp, prefix=prefix)
 
 
 if __name__ == "__main__":
     port = int(os.environ.get("PORT", "8000"))
     logger.info("Starting onboarding-mcp on port {port}", port=port)
-    mcp.run(transport="http", host="0.0.0.0", port=port, path="/mcp")
+    # mcp.run() starts its own event loop through anyio, so uvicorn's `loop`
+    # option would be ignored; uvloop is selected at the anyio level instead.
+    # Access logs are off since tools already log each CAPI call.
+    anyio.run(
+        functools.partial(
+            mcp.run_async,
+            transport="http",
+            host="0.0.0.0",
+            port=port,
+            path="/mcp",
+            uvicorn_config={"http": "httptools", "access_log": False},
+        ),
+        backend_options={"use_uvloop": find_spec("uvloop") is not None},
+    )
@@ -0,0 +1,35 @@
+"""Shared fixtures for the onboarding MCP tool tests."""
+
+from collections.abc import Callable, Iterator
+from types import SimpleNamespace
+
+import httpx
+import pytest
+import utils
+
+
+@pytest.fixture
+def ctx() -> SimpleNamespace:
+    """A stand-in tool Context whose HTTP request already carries the API key."""
+    state = SimpleNamespace(api_key="key")
+    return SimpleNamespace(
+        request_context=SimpleNamespace(request=SimpleNamespace(state=state))
+    )
+
+
+@pytest.fixture
+def capi_handler(
+    monkeypatch: pytest.MonkeyPatch,
+) -> Iterator[Callable[[Callable[[httpx.Request], httpx.Response]], None]]:
+    """Route the shared CAPI client through a handler instead of the network."""
+
+    def install(handler: Callable[[httpx.Request], httpx.Response]) -> None:
+        monkeypatch.setattr(
+            utils,
+            "http_client",
+            httpx.AsyncClient(
+                base_url=utils.CAPI_BASE_URL, transport=httpx.MockTransport(handler)
+            ),
+        )
+
+    yield install
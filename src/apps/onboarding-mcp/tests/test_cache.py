@@ -0,0 +1,140 @@
+"""Tests for the cached_tool single-flight cache."""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+from tools._cache import cached_tool, invalidates_cache
+
+
+def _counting_tool(
+    started: asyncio.Event, release: asyncio.Event
+) -> tuple[list[str], object]:
+    calls: list[str] = []
+
+    @cached_tool()
+    async def tool(ctx: SimpleNamespace, value: str) -> str:
+        calls.append(value)
+        started.set()
+        await release.wait()
+        return f"result-{value}"
+
+    return calls, tool
+
+
+class TestCachedTool:
+    """Test result caching and coalescing of concurrent calls."""
+
+    def test_concurrent_calls_are_coalesced_and_cached(
+        self, ctx: SimpleNamespace
+    ) -> None:
+        """Identical concurrent calls should hit the wrapped tool once."""
+
+        async def run() -> None:
+            started, release = asyncio.Event(), asyncio.Event()
+            calls, tool = _counting_tool(started, release)
+
+            first = asyncio.create_task(tool(ctx, "a"))
+            await started.wait()
+            second = asyncio.create_task(tool(ctx, "a"))
+            await asyncio.sleep(0)
+            release.set()
+
+            assert await first == await second == "result-a"
+            assert await tool(ctx, "a") == "result-a"
+            assert calls == ["a"]
+
+        asyncio.run(run())
+
+    def test_errors_reach_coalesced_waiters(self, ctx: SimpleNamespace) -> None:
+        """A failing shared call should raise in every waiting caller."""
+
+        async def run() -> None:
+            started = asyncio.Event()
+
+            @cached_tool()
+            async def tool(ctx: SimpleNamespace) -> str:
+                started.set()
+                await asyncio.sleep(0.01)
+                raise ValueError("boom")
+
+            first = asyncio.create_task(tool(ctx))
+            await started.wait()
+            second = asyncio.create_task(tool(ctx))
+
+            for task in (first, second):
+                with pytest.raises(ValueError):
+                    await task
+
+        asyncio.run(run())
+
+    def test_cancelled_leader_does_not_cancel_waiters(
+        self, ctx: SimpleNamespace
+    ) -> None:
+        """A waiter should re-run the call when the leading caller is cancelled."""
+
+        async def run() -> None:
+            started, release = asyncio.Event(), asyncio.Event()
+            calls, tool = _counting_tool(started, release)
+
+            leader = asyncio.create_task(tool(ctx, "a"))
+            await started.wait()
+            waiter = asyncio.create_task(tool(ctx, "a"))
+            await asyncio.sleep(0)
+
+            leader.cancel()
+            release.set()
+
+            assert await asyncio.wait_for(waiter, timeout=1) == "result-a"
+            assert leader.cancelled()
+            assert calls == ["a", "a"]
+
+        asyncio.run(run())
+
+
+class TestInvalidatesCache:
+    """Test that write tools drop cached reads for the caller's API key."""
+
+    def test_write_drops_cached_reads(self, ctx: SimpleNamespace) -> None:
+        """A read after a write should call the wrapped tool again."""
+
+        async def run() -> None:
+            started, release = asyncio.Event(), asyncio.Event()
+            release.set()
+            calls, tool = _counting_tool(started, release)
+
+            @invalidates_cache
+            async def write(ctx: SimpleNamespace) -> str:
+                return "ok"
+
+            await tool(ctx, "a")
+            await tool(ctx, "a")
+            await write(ctx)
+            await tool(ctx, "a")
+            assert calls == ["a", "a"]
+
+        asyncio.run(run())
+
+    def test_read_in_flight_during_write_is_not_cached(
+        self, ctx: SimpleNamespace
+    ) -> None:
+        """A read started before a write should not store its result."""
+
+        async def run() -> None:
+            started, release = asyncio.Event(), asyncio.Event()
+            calls, tool = _counting_tool(started, release)
+
+            @invalidates_cache
+            async def write(ctx: SimpleNamespace) -> str:
+                return "ok"
+
+            read = asyncio.create_task(tool(ctx, "a"))
+            await started.wait()
+            await write(ctx)
+            release.set()
+            await read
+
+            await tool(ctx, "a")
+            assert calls == ["a", "a"]
+
+        asyncio.run(run())
@@ -0,0 +1,62 @@
+"""Tests for the CAPI tool functions."""
+
+import asyncio
+from types import SimpleNamespace
+
+import httpx
+import orjson
+from lib_logger import configure_logging, reset_logging
+from lib_logger.adapters import ConsoleAdapter
+from tools.addons import get_available_addons
+from tools.queues import add_queue_members, list_queues
+
+
+class TestAddonTools:
+    """Test the add-on tools."""
+
+    def setup_method(self) -> None:
+        """Log at INFO so every tool log line is formatted."""
+        reset_logging()
+        configure_logging(adapters=[ConsoleAdapter(level="INFO")])
+
+    def test_get_available_addons_logs_and_returns_addons(
+        self, ctx: SimpleNamespace, capi_handler
+    ) -> None:
+        """The tool should log at INFO and return the CAPI payload."""
+        addons = [{"key": "addon-1"}, {"key": "addon-2"}]
+        capi_handler(lambda request: httpx.Response(200, json=addons))
+
+        result = asyncio.run(get_available_addons.fn(ctx, "extension-1"))
+
+        assert orjson.loads(result) == addons
+
+
+class TestQueueTools:
+    """Test the queue tools."""
+
+    def test_add_queue_members_refreshes_list_queues(
+        self, ctx: SimpleNamespace, capi_handler
+    ) -> None:
+        """Listing queues after adding members should not return the cached list."""
+        queues: list[dict] = [{"extension": "queue-1", "members": []}]
+        gets: list[str] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.method == "GET":
+                gets.append(request.url.path)
+                return httpx.Response(200, json=queues)
+            queues[0]["members"].extend(orjson.loads(request.content))
+            return httpx.Response(200, json={})
+
+        capi_handler(handler)
+
+        async def run() -> None:
+            assert orjson.loads(await list_queues.fn(ctx)) == [
+                {"extension": "queue-1", "members": []}
+            ]
+            await add_queue_members.fn(ctx, "queue-1", [{"extension": "100"}])
+            assert orjson.loads(await list_queues.fn(ctx)) == queues
+
+        asyncio.run(run())
+
+        assert len(gets) == 2
@@ -0,0 +1,69 @@
+"""Tests for the shared CAPI helpers."""
+
+import asyncio
+from types import SimpleNamespace
+
+import httpx
+import pytest
+from utils import capi, get_api_key
+
+
+class TestCapiRetries:
+    """Test retrying of transient CAPI failures."""
+
+    def test_get_is_retried_until_it_succeeds(
+        self, ctx: SimpleNamespace, capi_handler
+    ) -> None:
+        """A GET should survive two 503 responses in a row."""
+        statuses = [503, 503, 200]
+        calls: list[int] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            calls.append(statuses[len(calls)])
+            return httpx.Response(calls[-1], json={"ok": True})
+
+        capi_handler(handler)
+
+        assert asyncio.run(capi(ctx, "GET", "/api/capi/v1/groups")) == {"ok": True}
+        assert calls == statuses
+
+    def test_post_is_sent_once(self, ctx: SimpleNamespace, capi_handler) -> None:
+        """A failing POST should not be resent."""
+        calls: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            calls.append(request)
+            return httpx.Response(503)
+
+        capi_handler(handler)
+
+        with pytest.raises(httpx.HTTPStatusError):
+            asyncio.run(capi(ctx, "POST", "/api/capi/v1/groups", json_body={}))
+        assert len(calls) == 1
+
+
+def _header_ctx(headers: dict[str, str]) -> SimpleNamespace:
+    request = SimpleNamespace(headers=headers, state=SimpleNamespace())
+    return SimpleNamespace(request_context=SimpleNamespace(request=request))
+
+
+class TestGetApiKey:
+    """Test resolving the caller's API key from the HTTP request."""
+
+    def test_bearer_key_is_parsed_once_and_cached(self) -> None:
+        """The key should be stored on request.state and reused from there."""
+        ctx = _header_ctx({"authorization": "Bearer secret"})
+
+        assert get_api_key(ctx) == "secret"
+        assert ctx.request_context.request.state.api_key == "secret"
+
+        ctx.request_context.request.headers = {}
+        assert get_api_key(ctx) == "secret"
+
+    def test_missing_authorization_header_raises(self) -> None:
+        """A request without an Authorization header should be rejected."""
+        ctx = _header_ctx({"content-type": "application/json"})
+
+        with pytest.raises(ValueError, match="No Authorization header"):
+            get_api_key(ctx)
+        assert not hasattr(ctx.request_context.request.state, "api_key")
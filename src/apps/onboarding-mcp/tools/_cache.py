@@ -0,0 +1,159 @@
+import asyncio
+import functools
+import hashlib
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from cachetools import TTLCache
+from fastmcp import Context
+from utils import get_api_key
+
+DEFAULT_TTL = 60
+MAX_SIZE = 1024
+
+_caches: dict[str, TTLCache] = {}
+_stats: dict[str, dict[str, int]] = {}
+_inflight: dict[str, dict[tuple, asyncio.Future[str]]] = {}
+# Bumped per API key hash on every write so in-flight reads started before the
+# write do not store their (possibly stale) result.
+_generations: dict[str, int] = {}
+_lock = asyncio.Lock()
+
+
+class _LeaderCancelled(Exception):
+    """Set on a shared call whose leading caller was cancelled; waiters retry."""
+
+
+def _hash_api_key(api_key: str) -> str:
+    return hashlib.blake2b(api_key.encode(), digest_size=8).hexdigest()
+
+
+def cached_tool(
+    ttl: float = DEFAULT_TTL,
+) -> Callable[[Callable[..., Awaitable[str]]], Callable[..., Awaitable[str]]]:
+    """
+    Cache the serialized response of a read-only tool for `ttl` seconds.
+
+    Entries are keyed by a hash of the caller's API key and the tool arguments,
+    so cache hits skip both the CAPI round-trip and JSON work. Concurrent misses
+    for the same key are coalesced: only the first caller hits the CAPI and the
+    rest await its result (or its error). If the first caller is cancelled, one of
+    the waiters takes over the call instead of being cancelled with it. Only apply
+    this to idempotent GET tools.
+    """
+
+    def decorator(
+        fn: Callable[..., Awaitable[str]],
+    ) -> Callable[..., Awaitable[str]]:
+        cache: TTLCache = TTLCache(maxsize=MAX_SIZE, ttl=ttl)
+        inflight: dict[tuple, asyncio.Future[str]] = {}
+        stats = {"hits": 0, "misses": 0, "coalesced": 0}
+        _caches[fn.__name__] = cache
+        _stats[fn.__name__] = stats
+        _inflight[fn.__name__] = inflight
+
+        @functools.wraps(fn)
+        async def wrapper(ctx: Context, *args: Any, **kwargs: Any) -> str:
+            key = (
+                _hash_api_key(get_api_key(ctx)),
+                args,
+                tuple(sorted(kwargs.items())),
+            )
+
+            while True:
+                async with _lock:
+                    result = cache.get(key)
+                    if result is not None:
+                        stats["hits"] += 1
+                        return result
+
+                    future = inflight.get(key)
+                    if future is None:
+                        future = asyncio.get_running_loop().create_future()
+                        inflight[key] = future
+                        generation = _generations.get(key[0], 0)
+                        leader = True
+                    else:
+                        leader = False
+
+                if leader:
+                    break
+
+                stats["coalesced"] += 1
+                try:
+                    # Shield so a cancelled waiter does not cancel the shared call.
+                    return await asyncio.shield(future)
+                except _LeaderCancelled:
+                    continue
+
+            stats["misses"] += 1
+            try:
+                result = await fn(ctx, *args, **kwargs)
+            except asyncio.CancelledError:
+                # Only this caller was cancelled: let a waiter re-run the call.
+                future.set_exception(_LeaderCancelled())
+                future.exception()
+                raise
+            except Exception as exc:
+                future.set_exception(exc)
+                # Mark the exception as retrieved in case nobody was waiting.
+                future.exception()
+                raise
+            else:
+                future.set_result(result)
+                async with _lock:
+                    if _generations.get(key[0], 0) == generation:
+                        cache[key] = result
+            finally:
+                if inflight.get(key) is future:
+                    del inflight[key]
+
+            return result
+
+        return wrapper
+
+    return decorator
+
+
+def invalidates_cache(
+    fn: Callable[..., Awaitable[str]],
+) -> Callable[..., Awaitable[str]]:
+    """
+    Drop every cached read for the caller's API key once a write tool returns.
+
+    The cache is cleared whether or not the write succeeded, since a failed
+    request may still have been partly applied by the CAPI.
+    """
+
+    @functools.wraps(fn)
+    async def wrapper(ctx: Context, *args: Any, **kwargs: Any) -> str:
+        try:
+            return await fn(ctx, *args, **kwargs)
+        finally:
+            await _invalidate(_hash_api_key(get_api_key(ctx)))
+
+    return wrapper
+
+
+async def _invalidate(key_hash: str) -> None:
+    async with _lock:
+        _generations[key_hash] = _generations.get(key_hash, 0) + 1
+        for name, cache in _caches.items():
+            for key in [key for key in cache if key[0] == key_hash]:
+                cache.pop(key, None)
+            inflight = _inflight[name]
+            for key in [key for key in inflight if key[0] == key_hash]:
+                del inflight[key]
+
+
+def get_cache_stats() -> dict[str, dict[str, int | float]]:
+    """Return hit/miss counters and current size for every cached tool."""
+    return {
+        name: {
+            **_stats[name],
+            "size": len(cache),
+            "max_size": int(cache.maxsize),
+            "ttl": cache.ttl,
+        }
+        for name, cache in _caches.items()
+    }
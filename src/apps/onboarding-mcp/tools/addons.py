@@ -1,9 +1,8 @@
-import json
-
-import httpx
-from lib_logger import LoggerCore
 from fastmcp import Context, FastMCP
-from utils import get_api_key
+from lib_logger import LoggerCore
+from utils import capi, count_items, dumps
+
+from tools._cache import invalidates_cache
 
 logger = LoggerCore.get_logger(__name__)
 
@@ -15,33 +14,21 @@ mcp = FastMCP("Add-ons")
     description="Retrieves a list of compatible and available add-on products for a specific user extension from the Telavox CAPI.",
     tags={"addons", "assortment"},
 )
-def get_available_addons(ctx: Context, user: str) -> str:
+async def get_available_addons(ctx: Context, user: str) -> str:
     """
     Retrieve available add-ons for a user extension.
 
     Args:
         user: The unique identifier or extension key (e.g., extension-7422411) of the user
     """
-    api_key = get_api_key(ctx)
-
-    response = httpx.get(
-        f"https://home.telavox.se/api/capi/v1/assortment/addons/{user}",
-        headers={"Authorization": f"Bearer {api_key}"},
-        timeout=60,
+    data = await capi(ctx, "GET", f"/api/capi/v1/assortment/addons/{user}")
+    logger.info(
+        "Retrieved {count} add-ons for user {user} from Telavox CAPI",
+        count=count_items(data),
+        user=user,
     )
-    response.raise_for_status()
 
-    data = response.json()
-    if isinstance(data, list):
-        count = len(data)
-    elif isinstance(data, dict) and isinstance(data.get("data"), list):
-        count = len(data["data"])
-    else:
-        count = 1
-
-    logger.info(f"Retrieved {count} add-ons for user {user} from Telavox CAPI")
-
-    return json.dumps(data, indent=2)
+    return dumps(data)
 
 
 @mcp.tool(
@@ -49,7 +36,8 @@ def get_available_addons(ctx: Context, user: str) -> str:
     description="Executes the purchase and assignment of a specific add-on product to a user extension.",
     tags={"addons", "purchase"},
 )
-def purchase_addon(ctx: Context, user: str, assortment_item: str) -> str:
+@invalidates_cache
+async def purchase_addon(ctx: Context, user: str, assortment_item: str) -> str:
     """
     Purchase and assign an add-on to a user.
 
@@ -57,16 +45,13 @@ def purchase_addon(ctx: Context, user: str, assortment_item: str) -> str:
         user: The unique identifier or extension key of the user
         assortment_item: The unique key of the add-on product to be purchased
     """
-    api_key = get_api_key(ctx)
-
-    response = httpx.post(
-        f"https://home.telavox.se/api/capi/v1/products/addons/{user}/{assortment_item}",
-        headers={"Authorization": f"Bearer {api_key}"},
-        timeout=60,
+    data = await capi(
+        ctx, "POST", f"/api/capi/v1/products/addons/{user}/{assortment_item}"
+    )
+    logger.info(
+        "Purchased add-on {assortment_item} for user {user} in Telavox CAPI",
+        assortment_item=assortment_item,
+        user=user,
     )
-    response.raise_for_status()
-
-    data = response.json()
-    logger.info(f"Purchased add-on {assortment_item} for user {user} in Telavox CAPI")
 
-    return json.dumps(data, indent=2)
+    return dumps(data)
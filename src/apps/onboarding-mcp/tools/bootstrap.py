@@ -0,0 +1,55 @@
+import asyncio
+
+from fastmcp import Context, FastMCP
+from lib_logger import LoggerCore
+from utils import capi, dumps
+
+from tools._cache import cached_tool
+
+logger = LoggerCore.get_logger(__name__)
+
+mcp = FastMCP("Bootstrap")
+
+
+@mcp.tool(
+    name="onboarding_bootstrap",
+    description="Retrieves the invoice places, user licenses, templates and groups needed to start onboarding in a country, fetched concurrently from the Telavox CAPI.",
+    tags={"onboarding", "invoice", "licenses", "templates", "groups"},
+)
+@cached_tool()
+async def onboarding_bootstrap(
+    ctx: Context, country_code: str, currency_code: str
+) -> str:
+    """
+    Retrieve the reference data used at the start of an onboarding flow.
+
+    Args:
+        country_code: ISO country code (e.g., SE)
+        currency_code: Currency code (e.g., SEK)
+    """
+    invoice_places, user_licenses, templates, groups = await asyncio.gather(
+        capi(ctx, "GET", f"/api/capi/v1/invoice-places/country-{country_code}"),
+        capi(
+            ctx,
+            "GET",
+            "/api/capi/v1/assortment/"
+            f"country-{country_code}/currency-{currency_code}/user-licenses",
+        ),
+        capi(ctx, "GET", "/api/capi/v1/templates"),
+        capi(ctx, "GET", "/api/capi/v1/groups"),
+    )
+    logger.info(
+        "Retrieved onboarding bootstrap data for {country_code}/{currency_code} "
+        "from Telavox CAPI",
+        country_code=country_code,
+        currency_code=currency_code,
+    )
+
+    return dumps(
+        {
+            "invoice_places": invoice_places,
+            "user_licenses": user_licenses,
+            "templates": templates,
+            "groups": groups,
+        }
+    )
@@ -1,8 +1,8 @@
-import json
-
 from fastmcp import Context, FastMCP
 from lib_logger import LoggerCore
-from utils import get_api_key
+from utils import dumps, get_api_key
+
+from tools import _cache
 
 logger = LoggerCore.get_logger(__name__)
 
@@ -24,7 +24,22 @@ def log_request(ctx: Context) -> str:
     api_key = get_api_key(ctx)
     logger.info("Retrieved request context for debug tool")
 
-    return json.dumps(
-        {"apiKey": api_key},
-        indent=2,
-    )
+    return dumps({"apiKey": api_key}, indent=False)
+
+
+@mcp.tool(
+    name="get_cache_stats",
+    description="Return hit/miss counters and sizes of the in-process response cache used by read-only tools.",
+    tags={"debug", "cache"},
+)
+def get_cache_stats() -> str:
+    """
+    Return statistics for the in-process tool response cache.
+
+    Returns:
+        A formatted JSON string with per-tool hits, misses, size and TTL
+    """
+    stats = _cache.get_cache_stats()
+    logger.info("Retrieved cache stats for {count} cached tools", count=len(stats))
+
+    return dumps(stats)
@@ -1,9 +1,8 @@
-import json
-
-import httpx
-from lib_logger import LoggerCore
 from fastmcp import Context, FastMCP
-from utils import get_api_key
+from lib_logger import LoggerCore
+from utils import capi, count_items, dumps
+
+from tools._cache import cached_tool, invalidates_cache
 
 logger = LoggerCore.get_logger(__name__)
 
@@ -15,30 +14,17 @@ mcp = FastMCP("Groups")
     description="Retrieves a list of all groups (such as queues or ring groups) configured within the Telavox system.",
     tags={"groups", "routing"},
 )
-def list_groups(ctx: Context) -> str:
+@cached_tool()
+async def list_groups(ctx: Context) -> str:
     """
     Retrieve a list of all groups from the Telavox CAPI.
     """
-    api_key = get_api_key(ctx)
-
-    response = httpx.get(
-        "https://home.telavox.se/api/capi/v1/groups",
-        headers={"Authorization": f"Bearer {api_key}"},
-        timeout=60,
+    data = await capi(ctx, "GET", "/api/capi/v1/groups")
+    logger.opt(lazy=True).info(
+        "Retrieved {count} groups from Telavox CAPI", count=lambda: count_items(data)
     )
-    response.raise_for_status()
 
-    data = response.json()
-    if isinstance(data, list):
-        count = len(data)
-    elif isinstance(data, dict) and isinstance(data.get("data"), list):
-        count = len(data["data"])
-    else:
-        count = 1
-
-    logger.info(f"Retrieved {count} groups from Telavox CAPI")
-
-    return json.dumps(data, indent=2)
+    return dumps(data)
 
 
 @mcp.tool(
@@ -46,7 +32,8 @@ def list_groups(ctx: Context) -> str:
     description="Updates the membership list for a specific group (such as a queue or ring group) in the Telavox CAPI.",
     tags={"groups", "members", "update"},
 )
-def update_group_members(ctx: Context, group_key: str, member_keys: str) -> str:
+@invalidates_cache
+async def update_group_members(ctx: Context, group_key: str, member_keys: str) -> str:
     """
     Update the membership list for a specific group.
 
@@ -54,18 +41,17 @@ def update_group_members(ctx: Context, group_key: str, member_keys: str) -> str:
         group_key: The unique identifier for the group to be updated
         member_keys: A comma-separated list of extension keys to be assigned as members
     """
-    api_key = get_api_key(ctx)
-
-    response = httpx.put(
-        f"https://home.telavox.se/api/capi/v1/groups/{group_key}/members",
-        headers={"Authorization": f"Bearer {api_key}"},
+    data = await capi(
+        ctx,
+        "PUT",
+        f"/api/capi/v1/groups/{group_key}/members",
         params={"memberKeys": member_keys},
-        timeout=60,
     )
-    response.raise_for_status()
-
-    data = response.json()
-    member_count = len([key for key in member_keys.split(",") if key.strip()])
-    logger.info(f"Updated {member_count} group members in Telavox CAPI")
+    logger.opt(lazy=True).info(
+        "Updated {count} group members in Telavox CAPI",
+        count=lambda: sum(
+            1 for key in member_keys.split(",") if key and not key.isspace()
+        ),
+    )
 
-    return json.dumps(data, indent=2)
+    return dumps(data)
@@ -1,9 +1,7 @@
-import json
-
-import httpx
 from lib_logger import LoggerCore
 from fastmcp import Context, FastMCP
-from utils import get_api_key
+from tools._cache import cached_tool
+from utils import capi, count_items, dumps
 
 logger = LoggerCore.get_logger(__name__)
 
@@ -15,30 +13,18 @@ mcp = FastMCP("Invoice Places")
     description="Retrieves a list of valid invoice places (billing locations) for a specific country from the Telavox CAPI.",
     tags={"invoice", "billing"},
 )
-def list_invoice_places(ctx: Context, country_code: str) -> str:
+@cached_tool()
+async def list_invoice_places(ctx: Context, country_code: str) -> str:
     """
     Retrieve invoice places for a specific country.
 
     Args:
         country_code: The ISO country code (e.g., SE) to filter the billing locations
     """
-    api_key = get_api_key(ctx)
-
-    response = httpx.get(
-        f"https://home.telavox.se/api/capi/v1/invoice-places/country-{country_code}",
-        headers={"Authorization": f"Bearer {api_key}"},
-        timeout=60,
+    data = await capi(ctx, "GET", f"/api/capi/v1/invoice-places/country-{country_code}")
+    logger.opt(lazy=True).info(
+        "Retrieved {count} invoice places from Telavox CAPI",
+        count=lambda: count_items(data),
     )
-    response.raise_for_status()
-
-    data = response.json()
-    if isinstance(data, list):
-        count = len(data)
-    elif isinstance(data, dict) and isinstance(data.get("data"), list):
-        count = len(data["data"])
-    else:
-        count = 1
-
-    logger.info(f"Retrieved {count} invoice places from Telavox CAPI")
 
-    return json.dumps(data, indent=2)
+    return dumps(data)
@@ -1,9 +1,8 @@
-import json
-
-import httpx
-from lib_logger import LoggerCore
 from fastmcp import Context, FastMCP
-from utils import get_api_key
+from lib_logger import LoggerCore
+from utils import capi, count_items, dumps, query_params
+
+from tools._cache import cached_tool, invalidates_cache
 
 logger = LoggerCore.get_logger(__name__)
 
@@ -15,7 +14,8 @@ mcp = FastMCP("Licenses")
     description="Retrieves available user licenses from Telavox CAPI with regional pricing based on geography and currency.",
     tags={"licenses", "assortment"},
 )
-def get_user_licenses(ctx: Context, country_code: str, currency_code: str) -> str:
+@cached_tool()
+async def get_user_licenses(ctx: Context, country_code: str, currency_code: str) -> str:
     """
     Retrieve available user licenses from Telavox CAPI.
 
@@ -23,30 +23,17 @@ def get_user_licenses(ctx: Context, country_code: str, currency_code: str) -> st
         country_code: ISO country code (e.g., SE)
         currency_code: Currency code (e.g., SEK)
     """
-    api_key = get_api_key(ctx)
-
     url = (
-        "https://home.telavox.se/api/capi/v1/assortment/"
+        "/api/capi/v1/assortment/"
         f"country-{country_code}/currency-{currency_code}/user-licenses"
     )
-    response = httpx.get(
-        url,
-        headers={"Authorization": f"Bearer {api_key}"},
-        timeout=60,
+    data = await capi(ctx, "GET", url)
+    logger.opt(lazy=True).info(
+        "Retrieved {count} user licenses from Telavox CAPI",
+        count=lambda: count_items(data),
     )
-    response.raise_for_status()
-
-    data = response.json()
-    if isinstance(data, list):
-        count = len(data)
-    elif isinstance(data, dict) and isinstance(data.get("data"), list):
-        count = len(data["data"])
-    else:
-        count = 1
 
-    logger.info(f"Retrieved {count} user licenses from Telavox CAPI")
-
-    return json.dumps(data, indent=2)
+    return dumps(data)
 
 
 @mcp.tool(
@@ -54,7 +41,8 @@ def get_user_licenses(ctx: Context, country_code: str, currency_code: str) -> st
     description="Executes a purchase of specific user licenses through the Telavox CAPI with optional invoice placement and quantity specification.",
     tags={"licenses", "purchase"},
 )
-def purchase_user_licenses(
+@invalidates_cache
+async def purchase_user_licenses(
     ctx: Context,
     country_code: str,
     currency_code: str,
@@ -72,29 +60,17 @@ def purchase_user_licenses(
         invoice_place: Specific billing location identifier (optional)
         quantity: Number of licenses to purchase (defaults to 1)
     """
-    api_key = get_api_key(ctx)
-
     url = (
-        "https://home.telavox.se/api/capi/v1/products/user-licenses/"
+        "/api/capi/v1/products/user-licenses/"
         f"country-{country_code}/currency-{currency_code}/{assortment_key}"
     )
 
-    params: dict[str, str | int] = {}
-    if invoice_place is not None:
-        params["invoice_place"] = invoice_place
-    if quantity is not None:
-        params["quantity"] = quantity
+    params = query_params(("invoice_place", invoice_place), ("quantity", quantity))
 
-    response = httpx.post(
-        url,
-        headers={"Authorization": f"Bearer {api_key}"},
-        params=params or None,
-        timeout=60,
-    )
-    response.raise_for_status()
-
-    data = response.json()
+    data = await capi(ctx, "POST", url, params=params)
     purchased_quantity = quantity if quantity is not None else 1
-    logger.info(f"Purchased {purchased_quantity} user licenses from Telavox CAPI")
+    logger.info(
+        "Purchased {count} user licenses from Telavox CAPI", count=purchased_quantity
+    )
 
-    return json.dumps(data, indent=2)
+    return dumps(data)
@@ -1,9 +1,8 @@
-import json
-
-import httpx
-from lib_logger import LoggerCore
 from fastmcp import Context, FastMCP
-from utils import get_api_key
+from lib_logger import LoggerCore
+from utils import capi, capi_text, dumps, query_params
+
+from tools._cache import cached_tool, invalidates_cache
 
 logger = LoggerCore.get_logger(__name__)
 
@@ -15,7 +14,8 @@ mcp = FastMCP("Phone Numbers")
     description="Retrieves a paginated list of available reserved phone numbers from the Telavox CAPI for a specific country.",
     tags={"phone_numbers", "reserved"},
 )
-def list_available_reserved_phone_numbers(
+@cached_tool()
+async def list_available_reserved_phone_numbers(
     ctx: Context,
     country_code: str,
     page_size: int | None = None,
@@ -29,31 +29,19 @@ def list_available_reserved_phone_numbers(
         page_size: The number of results to return per page (defaults to 50)
         page_number: The specific page index to retrieve (defaults to 0)
     """
-    api_key = get_api_key(ctx)
-
     params: dict[str, str | int] = {"country": f"country-{country_code}"}
     params["pageSize"] = page_size if page_size is not None else 50
     params["pageNumber"] = page_number if page_number is not None else 0
 
-    response = httpx.get(
-        "https://home.telavox.se/api/capi/v1/reserved-phone-numbers/available",
-        headers={"Authorization": f"Bearer {api_key}"},
-        params=params,
-        timeout=60,
+    body = await capi_text(
+        ctx, "GET", "/api/capi/v1/reserved-phone-numbers/available", params=params
+    )
+    logger.info(
+        "Retrieved {length} characters of reserved phone numbers from Telavox CAPI",
+        length=len(body),
     )
-    response.raise_for_status()
-
-    data = response.json()
-    if isinstance(data, list):
-        count = len(data)
-    elif isinstance(data, dict) and isinstance(data.get("data"), list):
-        count = len(data["data"])
-    else:
-        count = 1
-
-    logger.info(f"Retrieved {count} reserved phone numbers from Telavox CAPI")
 
-    return json.dumps(data, indent=2)
+    return body
 
 
 @mcp.tool(
@@ -61,7 +49,8 @@ def list_available_reserved_phone_numbers(
     description="Purchases one or multiple phone numbers from the reserved inventory and assigns them to the organization's account.",
     tags={"phone_numbers", "purchase"},
 )
-def purchase_phone_number(
+@invalidates_cache
+async def purchase_phone_number(
     ctx: Context,
     body: list[dict],
     invoice_place: str | None = None,
@@ -76,25 +65,18 @@ def purchase_phone_number(
         body: An array of objects containing number details (e.g., e164Number, country, usages, key)
         invoice_place: The specific billing location identifier (optional)
     """
-    api_key = get_api_key(ctx)
-
-    params: dict[str, str] = {}
-    if invoice_place is not None:
-        params["invoiceplace"] = invoice_place
-
-    response = httpx.post(
-        "https://home.telavox.se/api/capi/v1/reserved-phone-numbers",
-        headers={"Authorization": f"Bearer {api_key}"},
-        params=params or None,
-        json=body,
-        timeout=60,
-    )
-    response.raise_for_status()
+    params = query_params(("invoiceplace", invoice_place))
 
-    data = response.json()
-    logger.info(f"Purchased {len(body)} phone numbers from Telavox CAPI")
+    data = await capi(
+        ctx,
+        "POST",
+        "/api/capi/v1/reserved-phone-numbers",
+        params=params,
+        json_body=body,
+    )
+    logger.info("Purchased {count} phone numbers from Telavox CAPI", count=len(body))
 
-    return json.dumps(data, indent=2)
+    return dumps(data)
 
 
 @mcp.tool(
@@ -102,7 +84,8 @@ def purchase_phone_number(
     description="Initiates the porting process to transfer an existing phone number from another operator to Telavox.",
     tags={"phone_numbers", "porting"},
 )
-def port_phone_number(ctx: Context, phone_number: str, body: dict) -> str:
+@invalidates_cache
+async def port_phone_number(ctx: Context, phone_number: str, body: dict) -> str:
     """
     Initiate a porting request for a phone number.
 
@@ -119,18 +102,16 @@ def port_phone_number(ctx: Context, phone_number: str, body: dict) -> str:
             parameter. The client will URL-encode the '+' automatically.
         body: A JSON object containing porting details such as preferredPortingDate, orgNumber, and the requested state
     """
-    api_key = get_api_key(ctx)
-
-    response = httpx.post(
-        "https://home.telavox.se/api/capi/v1/portings",
-        headers={"Authorization": f"Bearer {api_key}"},
+    data = await capi(
+        ctx,
+        "POST",
+        "/api/capi/v1/portings",
         params={"startE164Number": phone_number},
-        json=body,
-        timeout=60,
+        json_body=body,
+    )
+    logger.info(
+        "Started porting request for {phone_number} via Telavox CAPI",
+        phone_number=phone_number,
     )
-    response.raise_for_status()
-
-    data = response.json()
-    logger.info(f"Started porting request for {phone_number} via Telavox CAPI")
 
-    return json.dumps(data, indent=2)
+    return dumps(data)
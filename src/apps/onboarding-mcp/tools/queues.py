@@ -1,9 +1,8 @@
-import json
-
-import httpx
-from lib_logger import LoggerCore
 from fastmcp import Context, FastMCP
-from utils import get_api_key
+from lib_logger import LoggerCore
+from utils import capi, count_items, dumps
+
+from tools._cache import cached_tool, invalidates_cache
 
 logger = LoggerCore.get_logger(__name__)
 
@@ -15,30 +14,17 @@ mcp = FastMCP("Queues")
     description="Retrieves a comprehensive list of all call queues configured within the Telavox system.",
     tags={"queues", "pbx"},
 )
-def list_queues(ctx: Context) -> str:
+@cached_tool()
+async def list_queues(ctx: Context) -> str:
     """
     Retrieve all call queues from Telavox.
     """
-    api_key = get_api_key(ctx)
-
-    response = httpx.get(
-        "https://home.telavox.se/api/capi/v1/extensions/pbx/queues",
-        headers={"Authorization": f"Bearer {api_key}"},
-        timeout=60,
+    data = await capi(ctx, "GET", "/api/capi/v1/extensions/pbx/queues")
+    logger.opt(lazy=True).info(
+        "Retrieved {count} queues from Telavox CAPI", count=lambda: count_items(data)
     )
-    response.raise_for_status()
 
-    data = response.json()
-    if isinstance(data, list):
-        count = len(data)
-    elif isinstance(data, dict) and isinstance(data.get("data"), list):
-        count = len(data["data"])
-    else:
-        count = 1
-
-    logger.info(f"Retrieved {count} queues from Telavox CAPI")
-
-    return json.dumps(data, indent=2)
+    return dumps(data)
 
 
 @mcp.tool(
@@ -46,7 +32,8 @@ def list_queues(ctx: Context) -> str:
     description="Assigns new members to a specific PBX call queue with member objects defining who should answer calls.",
     tags={"queues", "members", "pbx"},
 )
-def add_queue_members(ctx: Context, extension: str, body: list[dict]) -> str:
+@invalidates_cache
+async def add_queue_members(ctx: Context, extension: str, body: list[dict]) -> str:
     """
     Add members to a PBX call queue.
 
@@ -54,17 +41,12 @@ def add_queue_members(ctx: Context, extension: str, body: list[dict]) -> str:
         extension: The extension identifier of the target PBX queue
         body: An array of member objects defining the extensions to be added to the queue
     """
-    api_key = get_api_key(ctx)
-
-    response = httpx.post(
-        f"https://home.telavox.se/api/capi/v1/extensions/pbx/queues/{extension}/members",
-        headers={"Authorization": f"Bearer {api_key}"},
-        json=body,
-        timeout=60,
+    data = await capi(
+        ctx,
+        "POST",
+        f"/api/capi/v1/extensions/pbx/queues/{extension}/members",
+        json_body=body,
     )
-    response.raise_for_status()
-
-    data = response.json()
-    logger.info(f"Added {len(body)} queue members in Telavox CAPI")
+    logger.info("Added {count} queue members in Telavox CAPI", count=len(body))
 
-    return json.dumps(data, indent=2)
+    return dumps(data)
@@ -1,9 +1,7 @@
-import json
-
-import httpx
 from lib_logger import LoggerCore
 from fastmcp import Context, FastMCP
-from utils import get_api_key
+from tools._cache import cached_tool
+from utils import capi, count_items, dumps
 
 logger = LoggerCore.get_logger(__name__)
 
@@ -15,27 +13,14 @@ mcp = FastMCP("Templates")
     description="Retrieves a list of available configuration templates from the Telavox CAPI used for predefined settings.",
     tags={"templates", "configuration"},
 )
-def list_templates(ctx: Context) -> str:
+@cached_tool()
+async def list_templates(ctx: Context) -> str:
     """
     Retrieve available configuration templates.
     """
-    api_key = get_api_key(ctx)
-
-    response = httpx.get(
-        "https://home.telavox.se/api/capi/v1/templates",
-        headers={"Authorization": f"Bearer {api_key}"},
-        timeout=60,
+    data = await capi(ctx, "GET", "/api/capi/v1/templates")
+    logger.opt(lazy=True).info(
+        "Retrieved {count} templates from Telavox CAPI", count=lambda: count_items(data)
     )
-    response.raise_for_status()
-
-    data = response.json()
-    if isinstance(data, list):
-        count = len(data)
-    elif isinstance(data, dict) and isinstance(data.get("data"), list):
-        count = len(data["data"])
-    else:
-        count = 1
-
-    logger.info(f"Retrieved {count} templates from Telavox CAPI")
 
-    return json.dumps(data, indent=2)
+    return dumps(data)
@@ -1,10 +1,214 @@
+import asyncio
+import functools
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import Any
+
+import httpx
+import orjson
 from fastmcp import Context
 from fastmcp.server.dependencies import get_http_headers
+from lib_logger import LoggerCore
+from tenacity import (
+    AsyncRetrying,
+    retry_if_exception,
+    stop_after_attempt,
+    wait_exponential_jitter,
+)
+
+logger = LoggerCore.get_logger(__name__)
+
+CAPI_BASE_URL = "https://home.telavox.se"
+
+# Shared client so every tool reuses pooled keep-alive connections (and their
+# TLS sessions) to the Telavox CAPI instead of opening one per call. HTTP/2
+# lets concurrent tool calls multiplex over a single connection, and the
+# transport retries failed connection attempts, which is safe for any method.
+http_client = httpx.AsyncClient(
+    base_url=CAPI_BASE_URL,
+    timeout=60,
+    transport=httpx.AsyncHTTPTransport(
+        http2=True,
+        limits=httpx.Limits(
+            max_keepalive_connections=32,
+            max_connections=64,
+            keepalive_expiry=30,
+        ),
+        retries=3,
+    ),
+)
+
+RETRYABLE_STATUS_CODES = frozenset({502, 503, 504})
+WARM_UP_TIMEOUT = 5
+
+
+async def warm_up_client() -> None:
+    """Open a connection to the Telavox CAPI ahead of the first tool call.
+
+    Resolves DNS and completes the TLS (and HTTP/2) handshake so the pooled
+    connection is ready. The whole attempt, including the transport's connect
+    retries, is capped at WARM_UP_TIMEOUT seconds. Failures are logged and
+    ignored: the first tool call will simply connect on its own.
+    """
+    try:
+        async with asyncio.timeout(WARM_UP_TIMEOUT):
+            response = await http_client.head("/")
+    except (httpx.HTTPError, TimeoutError) as exc:
+        logger.warning("Telavox CAPI warm-up failed: {error!r}", error=exc)
+        return
+    logger.debug(
+        "Telavox CAPI warm-up connected over {http_version}",
+        http_version=response.http_version,
+    )
+
+
+def dumps(obj: Any, *, indent: bool = True) -> str:
+    """Serialize a tool response to JSON text, pretty-printed by default.
+
+    Tools return this text rather than the decoded object: FastMCP would
+    re-serialize a dict/list return and also attach it as structured content,
+    sending the payload twice. orjson emits raw UTF-8 for non-ASCII data (e.g.
+    Swedish names), so the bytes are decoded as UTF-8, not ASCII.
+    """
+    option = orjson.OPT_NON_STR_KEYS
+    if indent:
+        option |= orjson.OPT_INDENT_2
+    return orjson.dumps(obj, option=option).decode()
+
+
+def loads(response: httpx.Response) -> Any:
+    """Parse a JSON response body straight from its raw bytes."""
+    return orjson.loads(response.content)
+
+
+@functools.lru_cache(maxsize=256)
+def _auth_headers(api_key: str, json_body: bool = False) -> Mapping[str, str]:
+    headers = {"Authorization": f"Bearer {api_key}"}
+    if json_body:
+        headers["Content-Type"] = "application/json"
+    return MappingProxyType(headers)
+
+
+def _is_retryable(exc: BaseException) -> bool:
+    if isinstance(exc, (httpx.ReadTimeout, httpx.RemoteProtocolError)):
+        return True
+    return (
+        isinstance(exc, httpx.HTTPStatusError)
+        and exc.response.status_code in RETRYABLE_STATUS_CODES
+    )
+
+
+async def _send(
+    method: str,
+    path: str,
+    headers: Mapping[str, str],
+    params: Any,
+    content: bytes | None,
+) -> httpx.Response:
+    response = await http_client.request(
+        method,
+        path,
+        headers=headers,
+        params=params,
+        content=content,
+    )
+    response.raise_for_status()
+    return response
+
+
+async def _request(
+    ctx: Context,
+    method: str,
+    path: str,
+    params: Any,
+    json_body: Any,
+) -> httpx.Response:
+    """Call the Telavox CAPI with the caller's API key.
+
+    GET requests are retried with jittered backoff on read timeouts, dropped
+    connections and 502/503/504 responses. Other methods are sent once.
+    """
+    # Serialize the body once with orjson (not httpx's stdlib json), outside
+    # the retry loop so retried attempts resend the same bytes.
+    if json_body is not None:
+        content = orjson.dumps(json_body)
+        headers = _auth_headers(get_api_key(ctx), True)
+    else:
+        content = None
+        headers = _auth_headers(get_api_key(ctx))
+
+    if method == "GET":
+        async for attempt in AsyncRetrying(
+            stop=stop_after_attempt(3),
+            wait=wait_exponential_jitter(multiplier=0.1, max=1.0),
+            retry=retry_if_exception(_is_retryable),
+            reraise=True,
+        ):
+            with attempt:
+                response = await _send(method, path, headers, params, content)
+    else:
+        response = await _send(method, path, headers, params, content)
+
+    return response
+
+
+async def capi(
+    ctx: Context,
+    method: str,
+    path: str,
+    *,
+    params: Any = None,
+    json_body: Any = None,
+) -> Any:
+    """Call the Telavox CAPI and return the parsed JSON body."""
+    return loads(await _request(ctx, method, path, params, json_body))
+
+
+async def capi_text(
+    ctx: Context,
+    method: str,
+    path: str,
+    *,
+    params: Any = None,
+) -> str:
+    """Call the Telavox CAPI and return the JSON body as-is, without parsing it.
+
+    For tools that only forward a (potentially large) payload: skipping the
+    parse and re-serialization avoids building the whole object graph.
+    """
+    response = await _request(ctx, method, path, params, None)
+    return response.content.decode()
+
+
+def query_params(*pairs: tuple[str, Any]) -> list[tuple[str, Any]] | None:
+    """Build query parameters from (name, value) pairs, dropping unset (None) ones.
+
+    Returns None when nothing is left so httpx skips query encoding entirely.
+    """
+    return [(name, value) for name, value in pairs if value is not None] or None
+
+
+def count_items(data: Any) -> int:
+    """Count the records in a CAPI payload (a bare list or a {"data": [...]} page)."""
+    if isinstance(data, list):
+        return len(data)
+    if isinstance(data, dict) and isinstance(data.get("data"), list):
+        return len(data["data"])
+    return 1
 
 
 def get_api_key(ctx: Context) -> str:
-    if ctx.request_context:
-        headers = getattr(ctx.request_context.request, "headers", {})
+    request = ctx.request_context.request if ctx.request_context else None
+    state = getattr(request, "state", None)
+
+    # Tools may resolve the key more than once per call (cache + request), so
+    # remember it on the HTTP request once it has been parsed.
+    api_key = getattr(state, "api_key", None)
+    if api_key is not None:
+        return api_key
+
+    if request is not None:
+        headers = request.headers
     else:
         headers = get_http_headers()
 
@@ -15,6 +219,9 @@ def get_api_key(ctx: Context) -> str:
     if not api_key:
         raise ValueError("No Authorization header found")
 
-    api_key = api_key.replace("Bearer ", "")
+    api_key = api_key.removeprefix("Bearer ")
+
+    if state is not None:
+        state.api_key = api_key
 
     return api_key
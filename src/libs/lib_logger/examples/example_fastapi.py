@@ -48,6 +48,8 @@ async def log_requests(request: Request, call_next):
     # Reset trace ID for each request
     LoggerCore.reset_trace_id()
     trace_id = LoggerCore.get_trace_id()
+    # Read the trace ID once per request; handlers reuse it from request.state
+    request.state.trace_id = trace_id
 
     logger.info(
         "Request started",
@@ -119,15 +121,16 @@ async def trigger_error() -> None:
 @app.exception_handler(ValueError)
 async def value_error_handler(request: Request, exc: ValueError) -> JSONResponse:
     """Handle ValueError exceptions."""
+    trace_id = request.state.trace_id
     logger.error(
         "ValueError occurred",
         error=str(exc),
         path=request.url.path,
-        trace_id=LoggerCore.get_trace_id(),
+        trace_id=trace_id,
     )
     return JSONResponse(
         status_code=500,
-        content={"error": str(exc), "trace_id": LoggerCore.get_trace_id()},
+        content={"error": str(exc), "trace_id": trace_id},
     )
 
 
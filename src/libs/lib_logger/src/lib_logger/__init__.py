@@ -23,12 +23,19 @@ Quick Start:
             JSONAdapter(level="DEBUG")
         ])
 
+    Cheap debug logging (values are only computed if DEBUG is enabled):
+        logger.opt(lazy=True).debug("Cart total: {total}", total=lambda: sum(prices))
+
     FastAPI integration:
         from lib_logger import configure_fastapi_logging
         from lib_logger.adapters import ConsoleAdapter
 
         app = FastAPI()
         configure_fastapi_logging(adapters=[ConsoleAdapter()])
+
+        # In middleware, read the trace ID once and share it via request.state
+        # rather than calling LoggerCore.get_trace_id() in every handler:
+        request.state.trace_id = LoggerCore.get_trace_id()
 """
 
 from __future__ import annotations
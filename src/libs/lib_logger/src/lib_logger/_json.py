@@ -0,0 +1,57 @@
+"""JSON encoding for structured log adapters.
+
+Uses orjson when it is installed (``lib-logger[orjson]``) and falls back to the
+standard library otherwise. Both produce the same UTF-8 JSON text, except that
+orjson encodes plain ``Enum`` members by value where the standard library falls
+back to ``str(member)``. Datetimes and dataclasses are passed to ``default`` in
+both cases. Values orjson rejects (e.g. integers wider than 64 bits) are
+encoded with the standard library too, so no record is dropped.
+"""
+
+import json
+from collections.abc import Callable
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without orjson
+    orjson = None
+else:
+    _ORJSON_OPTIONS = (
+        orjson.OPT_NON_STR_KEYS
+        | orjson.OPT_PASSTHROUGH_DATETIME
+        | orjson.OPT_PASSTHROUGH_DATACLASS
+    )
+
+
+def _stdlib_dumps(value: Any, default: Callable[[Any], Any] = str) -> str:
+    return json.dumps(value, default=default, ensure_ascii=False)
+
+
+def _stdlib_dumps_line(value: Any, default: Callable[[Any], Any] = str) -> bytes:
+    return (json.dumps(value, default=default, ensure_ascii=False) + "\n").encode()
+
+
+def _orjson_dumps(value: Any, default: Callable[[Any], Any] = str) -> str:
+    try:
+        return orjson.dumps(value, default=default, option=_ORJSON_OPTIONS).decode()
+    except TypeError:
+        return _stdlib_dumps(value, default)
+
+
+def _orjson_dumps_line(value: Any, default: Callable[[Any], Any] = str) -> bytes:
+    try:
+        return orjson.dumps(
+            value,
+            default=default,
+            option=_ORJSON_OPTIONS | orjson.OPT_APPEND_NEWLINE,
+        )
+    except TypeError:
+        return _stdlib_dumps_line(value, default)
+
+
+dumps = _stdlib_dumps if orjson is None else _orjson_dumps
+"""Encode a value as JSON text."""
+
+dumps_line = _stdlib_dumps_line if orjson is None else _orjson_dumps_line
+"""Encode a value as one newline-terminated line of UTF-8 JSON bytes."""
@@ -0,0 +1,123 @@
+"""Buffered stream writer that coalesces log lines into larger writes."""
+
+import atexit
+import os
+import sys
+import threading
+import weakref
+from typing import TextIO
+
+from loguru import logger as _loguru_logger
+
+# Live writers, flushed by a single atexit hook. Weak references let adapters
+# that are no longer used be garbage collected.
+_writers: weakref.WeakSet["BatchingWriter"] = weakref.WeakSet()
+
+
+def _flush_all() -> None:
+    # This hook runs before loguru's own exit hook, so records still queued by
+    # enqueue=True sinks must be drained into the writers before flushing.
+    _loguru_logger.complete()
+    for writer in list(_writers):
+        writer.flush()
+
+
+def _reset_after_fork() -> None:
+    # The child inherits the parent's buffer (the parent still writes it), its
+    # lock state and a timer whose thread does not exist in the child.
+    for writer in list(_writers):
+        writer._buffer = bytearray()
+        writer._lock = threading.Lock()
+        writer._timer = None
+
+
+atexit.register(_flush_all)
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
+
+
+def _stdout_fileno() -> int | None:
+    """Return the stdout file descriptor, or None if stdout is not a real file."""
+    try:
+        return sys.stdout.fileno()
+    except (AttributeError, OSError, ValueError):
+        return None
+
+
+class BatchingWriter:
+    """Accumulate encoded log lines and write them to a text stream in batches.
+
+    Batches go to the stream's binary `buffer` after flushing any text already
+    pending on the stream, so they stay in order with `print()` output and go
+    wherever the stream does. Streams without a binary buffer (such as
+    `io.StringIO`) get the decoded text instead.
+
+    The buffer is flushed when it reaches `max_bytes`, or `max_ms` milliseconds
+    after the first line of a batch was written, whichever comes first. Urgent
+    lines (the adapters pass ERROR and above) flush the buffer right away.
+    Pending lines are also flushed at interpreter exit, but not if the process
+    is killed (e.g. SIGKILL or OOM), so up to `max_ms` of lower-level lines can
+    be lost then.
+    """
+
+    __slots__ = (
+        "_stream",
+        "_max_bytes",
+        "_interval",
+        "_buffer",
+        "_lock",
+        "_timer",
+        "__weakref__",
+    )
+
+    def __init__(self, stream: TextIO, max_bytes: int = 65536, max_ms: float = 50):
+        """Initialize the writer.
+
+        Args:
+            stream: Text stream to write to (e.g. `sys.stdout`)
+            max_bytes: Flush once this many bytes are buffered
+            max_ms: Flush at most this many milliseconds after a batch starts
+        """
+        self._stream = stream
+        self._max_bytes = max_bytes
+        self._interval = max_ms / 1000
+        self._buffer = bytearray()
+        self._lock = threading.Lock()
+        self._timer: threading.Timer | None = None
+        _writers.add(self)
+
+    def write(self, data: bytes, urgent: bool = False) -> None:
+        """Buffer `data`, flushing immediately if urgent or the batch is full."""
+        with self._lock:
+            self._buffer += data
+            if urgent or len(self._buffer) >= self._max_bytes:
+                self._flush_locked()
+            elif self._timer is None:
+                self._timer = threading.Timer(self._interval, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+
+    def flush(self) -> None:
+        """Write out everything buffered so far."""
+        with self._lock:
+            self._flush_locked()
+
+    def _flush_locked(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if not self._buffer:
+            return
+
+        stream = self._stream
+        try:
+            binary = getattr(stream, "buffer", None)
+            if binary is None:
+                stream.write(self._buffer.decode())
+                stream.flush()
+            else:
+                stream.flush()
+                binary.write(self._buffer)
+                binary.flush()
+        finally:
+            self._buffer.clear()
@@ -1,8 +1,35 @@
 """Base adapter interface for logging outputs."""
 
+import logging
 from abc import ABC, abstractmethod
 from typing import Any
 
+from loguru import logger as _loguru_logger
+
+# Numeric rank of the standard levels, matching stdlib logging and loguru's
+# `record["level"].no`, so checks reduce to a single int comparison. Other
+# levels (TRACE, SUCCESS, custom ones) are resolved through loguru.
+_RANKS = {
+    "DEBUG": logging.DEBUG,
+    "INFO": logging.INFO,
+    "WARNING": logging.WARNING,
+    "ERROR": logging.ERROR,
+    "CRITICAL": logging.CRITICAL,
+}
+
+
+def _rank(level: int | str) -> int:
+    """Return the numeric rank of a level given by number or name."""
+    if isinstance(level, int):
+        return level
+    rank = _RANKS.get(level) or _RANKS.get(level.upper())
+    if rank is None:
+        try:
+            rank = _loguru_logger.level(level).no
+        except ValueError:
+            rank = _loguru_logger.level(level.upper()).no
+    return rank
+
 
 class BaseAdapter(ABC):
     """Abstract base class for logging adapters.
@@ -11,16 +38,36 @@ class BaseAdapter(ABC):
     Each adapter receives structured log data and outputs it in a specific format.
     """
 
-    def __init__(self, level: str = "DEBUG", **kwargs: Any):
+    __slots__ = ("_level", "_min_rank", "enqueue", "config")
+
+    def __init__(
+        self, level: int | str = "DEBUG", enqueue: bool = False, **kwargs: Any
+    ):
         """Initialize adapter.
 
         Args:
-            level: Minimum log level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
+            level: Minimum log level, as a name known to loguru (TRACE, DEBUG,
+                INFO, SUCCESS, WARNING, ERROR, CRITICAL or a custom level) or
+                a number
+            enqueue: Hand records to a background thread that formats and
+                writes them, so logging calls never block on I/O. Call
+                `logger.complete()` before exit to drain pending records.
             **kwargs: Additional adapter-specific configuration
         """
         self.level = level
+        self.enqueue = enqueue
         self.config = kwargs
 
+    @property
+    def level(self) -> int | str:
+        """Minimum log level of this adapter."""
+        return self._level
+
+    @level.setter
+    def level(self, value: int | str) -> None:
+        self._min_rank = _rank(value)
+        self._level = value
+
     @abstractmethod
     def format_record(self, record: dict[str, Any]) -> str:
         """Format a log record for output.
@@ -45,20 +92,25 @@ class BaseAdapter(ABC):
             - level: Minimum level
             - colorize: Enable colors
             - serialize: Enable JSON output
+            - enqueue: Write from a background thread
             - etc.
         """
         pass
 
-    def should_log(self, level: str) -> bool:
+    def flush(self) -> None:
+        """Write out any output the adapter has buffered.
+
+        Adapters that write synchronously have nothing to flush.
+        """
+
+    def should_log(self, level: int | str) -> bool:
         """Check if a log level should be logged.
 
         Args:
-            level: Log level to check
+            level: Numeric level (e.g. `record["level"].no` or `logging.INFO`),
+                or a level name. Numbers take the fast path.
 
         Returns:
             True if level should be logged
         """
-        levels = ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
-        min_level_idx = levels.index(self.level.upper())
-        current_level_idx = levels.index(level.upper())
-        return current_level_idx >= min_level_idx
+        return _rank(level) >= self._min_rank
@@ -5,6 +5,17 @@ from typing import Any
 
 from lib_logger.adapters.base import BaseAdapter
 
+# Kept as a static string: loguru parses it and its color tags once in add(),
+# whereas a callable format's output would be re-parsed for every record.
+_FORMAT = (
+    "<green>{time:YYYY-MM-DD HH:mm:ss}</green> | "
+    "<level>{level: <8}</level> | "
+    "<dim>{extra[trace_id]}</dim> | "
+    "<cyan>{extra[name]}</cyan> | "
+    "<dim>{file}:{line}</dim> | "
+    "<level>{message}</level>"
+)
+
 
 class ConsoleAdapter(BaseAdapter):
     """Console adapter with colored output (default adapter).
@@ -16,7 +27,11 @@ class ConsoleAdapter(BaseAdapter):
         2026-02-05 21:55:32 | INFO     | 05556afc | api | main.py:42 | Request received
     """
 
-    def __init__(self, level: str = "DEBUG", colorize: bool = True, **kwargs: Any):
+    __slots__ = ("colorize",)
+
+    def __init__(
+        self, level: int | str = "DEBUG", colorize: bool = True, **kwargs: Any
+    ):
         """Initialize console adapter.
 
         Args:
@@ -39,14 +54,8 @@ class ConsoleAdapter(BaseAdapter):
         """
         return {
             "sink": sys.stderr,
-            "format": (
-                "<green>{time:YYYY-MM-DD HH:mm:ss}</green> | "
-                "<level>{level: <8}</level> | "
-                "<dim>{extra[trace_id]}</dim> | "
-                "<cyan>{extra[name]}</cyan> | "
-                "<dim>{file}:{line}</dim> | "
-                "<level>{message}</level>"
-            ),
+            "format": _FORMAT,
             "level": self.level,
+            "enqueue": self.enqueue,
             "colorize": self.colorize,
         }
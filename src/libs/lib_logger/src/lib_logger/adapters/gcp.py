@@ -4,13 +4,35 @@ This adapter emits one JSON object per line to stdout, following Google Cloud
 structured logging conventions (Cloud Run, GKE, Compute Engine).
 """
 
-import re
+import logging
+import os
 import sys
 from datetime import timezone
 from typing import Any
 
+from lib_logger._json import dumps as _dumps
+from lib_logger._json import dumps_line as _dumps_line
+from lib_logger.adapters._batch import BatchingWriter, _stdout_fileno
 from lib_logger.adapters.base import BaseAdapter
 
+_UTC = timezone.utc
+
+# Extra keys that are mapped to dedicated GCP fields instead of copied as-is.
+_SKIP_EXTRAS = frozenset(("trace_id", "name"))
+
+# Map loguru levels to GCP severity
+_GCP_SEVERITY = {
+    "TRACE": "DEBUG",
+    "DEBUG": "DEBUG",
+    "INFO": "INFO",
+    "SUCCESS": "INFO",
+    "WARNING": "WARNING",
+    "ERROR": "ERROR",
+    "CRITICAL": "CRITICAL",
+}
+# Maps lowercase hex digits to 0 and every other byte to 1.
+_HEX_TABLE = bytes(0 if chr(i) in "0123456789abcdef" else 1 for i in range(256))
+
 
 class GCPAdapter(BaseAdapter):
     """Google Cloud Platform logging adapter.
@@ -32,18 +54,36 @@ class GCPAdapter(BaseAdapter):
          "sourceLocation": {"file": "main.py", "line": "42", "function": "handle_request"}}
     """
 
+    __slots__ = ("project_id", "_stdout_fd", "_writer")
+
     def __init__(
-        self, level: str = "DEBUG", project_id: str | None = None, **kwargs: Any
+        self,
+        level: int | str = "DEBUG",
+        project_id: str | None = None,
+        batch_bytes: int = 65536,
+        batch_ms: float = 50,
+        **kwargs: Any,
     ):
         """Initialize GCP adapter.
 
         Args:
             level: Minimum log level
             project_id: GCP project ID (optional, for full trace format)
+            batch_bytes: Coalesce log lines and write them once this many bytes
+                are buffered; 0 writes every line immediately. ERROR and above
+                are always written at once; if the process is killed, up to
+                `batch_ms` of lower-level lines can be lost
+            batch_ms: Maximum time in milliseconds a line stays buffered
             **kwargs: Additional configuration
         """
         super().__init__(level, **kwargs)
         self.project_id = project_id
+        self._stdout_fd = _stdout_fileno()
+        self._writer = (
+            BatchingWriter(sys.stdout, max_bytes=batch_bytes, max_ms=batch_ms)
+            if batch_bytes > 0
+            else None
+        )
 
     def format_record(self, record: dict[str, Any]) -> str:
         """Format record for GCP (handled by custom formatter)."""
@@ -52,7 +92,8 @@ class GCPAdapter(BaseAdapter):
     @staticmethod
     def _is_gcp_trace_id(value: str) -> bool:
         """Return True if value looks like a GCP trace id (32 hex chars)."""
-        return bool(re.fullmatch(r"[0-9a-f]{32}", value))
+        data = value.encode("ascii", "replace")
+        return len(data) == 32 and b"\x01" not in data.translate(_HEX_TABLE)
 
     @staticmethod
     def _json_default(value: Any) -> str:
@@ -68,30 +109,25 @@ class GCPAdapter(BaseAdapter):
         Returns:
             JSON formatted for GCP
         """
-        import json
-
-        # Map loguru levels to GCP severity
-        level_map = {
-            "TRACE": "DEBUG",
-            "DEBUG": "DEBUG",
-            "INFO": "INFO",
-            "SUCCESS": "INFO",
-            "WARNING": "WARNING",
-            "ERROR": "ERROR",
-            "CRITICAL": "CRITICAL",
-        }
+        return _dumps(self._gcp_entry(record), self._json_default)
 
-        severity = level_map.get(record["level"].name, "INFO")
+    def _gcp_entry(self, record: dict[str, Any]) -> dict[str, Any]:
+        """Build the GCP structured logging payload for a loguru record."""
+        severity = _GCP_SEVERITY.get(record["level"].name, "INFO")
 
         # Build GCP-compatible log entry
         record_time = record["time"]
         record_dt = (
             record_time.datetime if hasattr(record_time, "datetime") else record_time
-        ).astimezone(timezone.utc)
+        ).astimezone(_UTC)
         log_entry = {
             "severity": severity,
             "message": record["message"],
-            "timestamp": record_dt.isoformat().replace("+00:00", "Z"),
+            "timestamp": (
+                f"{record_dt.year:04d}-{record_dt.month:02d}-{record_dt.day:02d}"
+                f"T{record_dt.hour:02d}:{record_dt.minute:02d}:{record_dt.second:02d}"
+                f".{record_dt.microsecond:06d}Z"
+            ),
             "logging.googleapis.com/sourceLocation": {
                 "file": record["file"].name,
                 "line": record["line"],
@@ -101,7 +137,10 @@ class GCPAdapter(BaseAdapter):
 
         # Add trace information.
         # NOTE: Google Cloud expects a 32-hex trace id for logging.googleapis.com/trace.
-        trace_id = str(record["extra"].get("trace_id", "") or "")
+        extra = record["extra"]
+        trace_id = extra.get("trace_id") or ""
+        if not isinstance(trace_id, str):
+            trace_id = str(trace_id)
         if trace_id:
             # Always include a trace_id field for internal correlation.
             log_entry["trace_id"] = trace_id
@@ -113,16 +152,18 @@ class GCPAdapter(BaseAdapter):
                 )
 
         # Add logger name
-        logger_name = record["extra"].get("name")
+        logger_name = extra.get("name")
         if logger_name:
-            log_entry["logger"] = str(logger_name)
+            log_entry["logger"] = (
+                logger_name if isinstance(logger_name, str) else str(logger_name)
+            )
 
         # Add any extra fields
-        for key, value in record["extra"].items():
-            if key not in ["trace_id", "name"]:
-                log_entry[key] = value
+        log_entry |= {
+            key: value for key, value in extra.items() if key not in _SKIP_EXTRAS
+        }
 
-        return json.dumps(log_entry, default=self._json_default, ensure_ascii=False)
+        return log_entry
 
     def _sink(self, message: Any) -> None:
         """Write a single structured log line to stdout.
@@ -130,9 +171,29 @@ class GCPAdapter(BaseAdapter):
         Loguru passes a `Message` object to callable sinks. The message contains
         the original `record` dict, which we transform into a GCP-compatible
         JSON payload.
+
+        By default lines are batched into larger writes through `sys.stdout`'s
+        binary buffer. With batching disabled the encoded line goes straight to
+        the stdout file descriptor with `os.write`, skipping the text layer, so
+        each line is one write(2), which is atomic on a pipe for lines up to
+        PIPE_BUF bytes.
         """
-        record = message.record
-        sys.stdout.write(self._gcp_formatter(record) + "\n")
+        payload = _dumps_line(self._gcp_entry(message.record), self._json_default)
+        if self._writer is not None:
+            self._writer.write(payload, message.record["level"].no >= logging.ERROR)
+            return
+        if self._stdout_fd is None:
+            sys.stdout.write(payload.decode())
+            return
+
+        view = memoryview(payload)
+        while view:
+            view = view[os.write(self._stdout_fd, view) :]
+
+    def flush(self) -> None:
+        """Write out any batched log lines."""
+        if self._writer is not None:
+            self._writer.flush()
 
     def get_sink_config(self) -> dict[str, Any]:
         """Get GCP sink configuration.
@@ -143,5 +204,6 @@ class GCPAdapter(BaseAdapter):
         return {
             "sink": self._sink,
             "level": self.level,
+            "enqueue": self.enqueue,
             "colorize": False,
         }
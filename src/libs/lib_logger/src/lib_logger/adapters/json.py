@@ -1,8 +1,12 @@
 """JSON adapter for structured logging output."""
 
+import logging
 import sys
 from typing import Any
 
+from lib_logger._json import dumps as _dumps
+from lib_logger._json import dumps_line as _dumps_line
+from lib_logger.adapters._batch import BatchingWriter
 from lib_logger.adapters.base import BaseAdapter
 
 
@@ -18,18 +22,104 @@ class JSONAdapter(BaseAdapter):
          "file": "main.py", "line": 42}
     """
 
-    def __init__(self, level: str = "DEBUG", **kwargs: Any):
+    __slots__ = ("_writer",)
+
+    def __init__(
+        self,
+        level: int | str = "DEBUG",
+        batch_bytes: int = 65536,
+        batch_ms: float = 50,
+        **kwargs: Any,
+    ):
         """Initialize JSON adapter.
 
         Args:
             level: Minimum log level
+            batch_bytes: Coalesce log lines and write them once this many bytes
+                are buffered; 0 writes every line immediately. ERROR and above
+                are always written at once; if the process is killed, up to
+                `batch_ms` of lower-level lines can be lost
+            batch_ms: Maximum time in milliseconds a line stays buffered
             **kwargs: Additional configuration
         """
         super().__init__(level, **kwargs)
+        self._writer = (
+            BatchingWriter(sys.stdout, max_bytes=batch_bytes, max_ms=batch_ms)
+            if batch_bytes > 0
+            else None
+        )
 
     def format_record(self, record: dict[str, Any]) -> str:
-        """Format record as JSON (handled by loguru serialize)."""
-        return ""  # Loguru handles JSON serialization
+        """Format record as JSON (handled by the custom sink)."""
+        return ""  # Custom sink handles JSON serialization
+
+    @staticmethod
+    def _entry(text: str, record: dict[str, Any]) -> dict[str, Any]:
+        """Build a record payload with the same layout as loguru's `serialize=True`."""
+        exception = record["exception"]
+        if exception is not None:
+            exception = {
+                "type": None if exception.type is None else exception.type.__name__,
+                "value": exception.value,
+                "traceback": bool(exception.traceback),
+            }
+
+        return {
+            "text": text,
+            "record": {
+                "elapsed": {
+                    "repr": str(record["elapsed"]),
+                    "seconds": record["elapsed"].total_seconds(),
+                },
+                "exception": exception,
+                "extra": record["extra"],
+                "file": {"name": record["file"].name, "path": record["file"].path},
+                "function": record["function"],
+                "level": {
+                    "icon": record["level"].icon,
+                    "name": record["level"].name,
+                    "no": record["level"].no,
+                },
+                "line": record["line"],
+                "message": record["message"],
+                "module": record["module"],
+                "name": record["name"],
+                "process": {
+                    "id": record["process"].id,
+                    "name": record["process"].name,
+                },
+                "thread": {
+                    "id": record["thread"].id,
+                    "name": record["thread"].name,
+                },
+                "time": {
+                    "repr": str(record["time"]),
+                    "timestamp": record["time"].timestamp(),
+                },
+            },
+        }
+
+    def _sink(self, message: Any) -> None:
+        """Write a single JSON log line to stdout.
+
+        Loguru's own `serialize=True` encodes with the stdlib json module; this
+        sink produces the same payload through the faster shared encoder. By
+        default lines are batched into larger writes to stdout, as in GCPAdapter.
+        """
+        entry = self._entry(str(message), message.record)
+        if self._writer is not None:
+            self._writer.write(
+                _dumps_line(entry), message.record["level"].no >= logging.ERROR
+            )
+            return
+        stream = sys.stdout
+        stream.write(_dumps(entry) + "\n")
+        stream.flush()
+
+    def flush(self) -> None:
+        """Write out any batched log lines."""
+        if self._writer is not None:
+            self._writer.flush()
 
     def get_sink_config(self) -> dict[str, Any]:
         """Get JSON sink configuration.
@@ -38,9 +128,9 @@ class JSONAdapter(BaseAdapter):
             Loguru sink config for JSON output
         """
         return {
-            "sink": sys.stdout,
+            "sink": self._sink,
             "format": "{message}",
             "level": self.level,
-            "serialize": True,  # Enable JSON serialization
+            "enqueue": self.enqueue,
             "colorize": False,
         }
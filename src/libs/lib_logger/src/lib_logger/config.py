@@ -12,8 +12,12 @@ from lib_logger.interceptor import InterceptHandler
 LOG_ENV_VAR = "LOG_ENV"
 GOOGLE_ENV_VALUE = "google"
 LOG_LEVEL_VAR = "LOG_LEVEL"
+LOG_ENQUEUE_VAR = "LOG_ENQUEUE"
 PROJECT_ID_VARS = ("GOOGLE_CLOUD_PROJECT", "GCP_PROJECT_ID")
 
+# Shared by every intercepted stdlib logger; the handler holds no per-logger state.
+_INTERCEPT_HANDLER = InterceptHandler()
+
 
 def configure_logging(
     adapters: list[BaseAdapter] | None = None,
@@ -61,10 +65,11 @@ def configure_logging(
             "sqlalchemy.engine",
         ]
 
-    # Setup interception
+    # Setup interception (skipping loggers that are already intercepted)
     for logger_name in stdlib_loggers:
         stdlib_logger = logging.getLogger(logger_name)
-        stdlib_logger.handlers = [InterceptHandler()]
+        if stdlib_logger.handlers != [_INTERCEPT_HANDLER]:
+            stdlib_logger.handlers = [_INTERCEPT_HANDLER]
         stdlib_logger.propagate = False
 
 
@@ -105,13 +110,19 @@ def configure_logging_from_env(**kwargs: Any) -> None:
     """Configure logging based on environment variables.
 
     Selects GCP adapter when LOG_ENV matches the provided value, otherwise
-    falls back to console output.
+    falls back to console output. Setting LOG_ENQUEUE to 1/true/yes makes the
+    adapter write from loguru's background thread (see BaseAdapter).
 
     Args:
         **kwargs: Additional arguments passed to configure_logging().
     """
     log_env = os.environ.get(LOG_ENV_VAR, "").strip().lower()
     level = os.environ.get(LOG_LEVEL_VAR, "INFO")
+    enqueue = os.environ.get(LOG_ENQUEUE_VAR, "").strip().lower() in {
+        "1",
+        "true",
+        "yes",
+    }
 
     project_id = None
     for var in PROJECT_ID_VARS:
@@ -121,9 +132,9 @@ def configure_logging_from_env(**kwargs: Any) -> None:
 
     adapters: list[BaseAdapter]
     if log_env == GOOGLE_ENV_VALUE:
-        adapters = [GCPAdapter(level=level, project_id=project_id)]
+        adapters = [GCPAdapter(level=level, project_id=project_id, enqueue=enqueue)]
     else:
-        adapters = [ConsoleAdapter(level=level)]
+        adapters = [ConsoleAdapter(level=level, enqueue=enqueue)]
 
     configure_logging(adapters=adapters, **kwargs)
 
@@ -136,8 +147,12 @@ def reset_logging() -> None:
     from loguru import logger as _loguru_logger
 
     _loguru_logger.remove()
+    for adapter in LoggerCore._adapters:
+        adapter.flush()
     LoggerCore._configured = False
-    LoggerCore._adapters = []
+    LoggerCore._adapters = ()
+    LoggerCore._min_levelno = 0
+    LoggerCore.invalidate_logger_cache()
 
     # Reset stdlib logging
     logging.basicConfig(force=True)
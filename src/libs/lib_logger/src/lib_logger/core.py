@@ -2,19 +2,42 @@
 
 from __future__ import annotations
 
-import uuid
+import functools
 from contextvars import ContextVar
+from os import urandom
+from random import getrandbits
 from typing import TYPE_CHECKING
 
 from loguru import logger as _loguru_logger
 
+from lib_logger.adapters import ConsoleAdapter
+
 if TYPE_CHECKING:
     from loguru import Logger
 
     from lib_logger.adapters.base import BaseAdapter
 
 # Context variable for async-safe trace ID storage
-_trace_id_var: ContextVar[str] = ContextVar("trace_id", default="")
+_trace_id_var: ContextVar[str | None] = ContextVar("trace_id", default=None)
+_get_trace_id = _trace_id_var.get
+
+
+def _new_trace_id(secure: bool = False) -> str:
+    """Generate an 8-hex-character trace ID.
+
+    Trace IDs only correlate log lines; they are not security tokens. By default
+    they come from the process-wide PRNG (reseeded after fork), which avoids a
+    kernel entropy call per ID. `secure=True` draws from os.urandom instead.
+    """
+    if secure:
+        return urandom(4).hex()
+    return f"{getrandbits(32):08x}"
+
+
+@functools.lru_cache(maxsize=1024)
+def _bound_logger(name: str, trace_id: str) -> Logger:
+    """Return the loguru logger bound to name and trace_id, reusing recent ones."""
+    return _loguru_logger.bind(name=name, trace_id=trace_id)
 
 
 class LoggerCore:
@@ -32,7 +55,10 @@ class LoggerCore:
     """
 
     _configured: bool = False
-    _adapters: list[BaseAdapter] = []
+    _adapters: tuple[BaseAdapter, ...] = ()
+    # Lowest level any adapter accepts; intercepted stdlib records below it
+    # are dropped before any work is done on them.
+    _min_levelno: int = 0
 
     @classmethod
     def configure(cls, adapters: list[BaseAdapter] | None = None) -> None:
@@ -44,13 +70,19 @@ class LoggerCore:
         if cls._configured:
             return
 
-        # Import here to avoid circular imports
-        from lib_logger.adapters import ConsoleAdapter
+        # Sinks kept by reset_for_tests() are still registered; reuse them
+        if cls._adapters and (adapters is None or tuple(adapters) == cls._adapters):
+            cls._configured = True
+            return
 
         if adapters is None:
             adapters = [ConsoleAdapter()]
 
-        cls._adapters = adapters
+        cls._adapters = tuple(adapters)
+        cls._min_levelno = min(
+            (adapter._min_rank for adapter in cls._adapters), default=0
+        )
+        cls.invalidate_logger_cache()
 
         # Remove default loguru handler
         _loguru_logger.remove()
@@ -72,9 +104,14 @@ class LoggerCore:
         Returns:
             A loguru logger bound to the given name and current trace_id.
         """
-        cls.configure()
-        trace_id = cls.get_trace_id()
-        return _loguru_logger.bind(name=name, trace_id=trace_id)
+        if not cls._configured:
+            cls.configure()
+        return _bound_logger(name, _get_trace_id() or cls.get_trace_id())
+
+    @classmethod
+    def invalidate_logger_cache(cls) -> None:
+        """Drop all memoized bound loggers returned by get_logger()."""
+        _bound_logger.cache_clear()
 
     @classmethod
     def get_trace_id(cls) -> str:
@@ -86,10 +123,13 @@ class LoggerCore:
         Returns:
             The 8-character trace ID for current context.
         """
-        trace_id = _trace_id_var.get()
-        if not trace_id:
-            trace_id = uuid.uuid4().hex[:8]
-            _trace_id_var.set(trace_id)
+        trace_id = _get_trace_id()
+        if trace_id:
+            return trace_id
+
+        # First access in this context: generate once, later calls only read.
+        trace_id = _new_trace_id()
+        _trace_id_var.set(trace_id)
         return trace_id
 
     @classmethod
@@ -105,14 +145,28 @@ class LoggerCore:
         _trace_id_var.set(trace_id)
 
     @classmethod
-    def reset_trace_id(cls) -> None:
+    def reset_trace_id(cls, secure: bool = False) -> None:
         """Reset trace ID for current context.
 
         Generates a new trace ID for the current async context.
         Useful at the start of new requests or tasks.
+
+        Args:
+            secure: Generate the ID from OS entropy, for callers that need
+                trace IDs to be unpredictable.
         """
-        trace_id = uuid.uuid4().hex[:8]
-        _trace_id_var.set(trace_id)
+        _trace_id_var.set(_new_trace_id(secure))
+
+    @classmethod
+    def reset_for_tests(cls) -> None:
+        """Mark logging unconfigured and start a new trace ID, keeping the sinks.
+
+        A lighter alternative to reset_logging() between tests: the adapters
+        and their loguru sinks stay registered, and the next configure() with
+        no adapters (or the same ones) reuses them instead of re-adding sinks.
+        """
+        cls._configured = False
+        cls.reset_trace_id()
 
     @classmethod
     def is_configured(cls) -> bool:
@@ -124,10 +178,10 @@ class LoggerCore:
         return cls._configured
 
     @classmethod
-    def get_adapters(cls) -> list[BaseAdapter]:
-        """Get list of configured adapters.
+    def get_adapters(cls) -> tuple[BaseAdapter, ...]:
+        """Get the configured adapters.
 
         Returns:
-            List of active adapter instances.
+            Tuple of active adapter instances.
         """
-        return cls._adapters.copy()
+        return cls._adapters
@@ -1,10 +1,35 @@
 """InterceptHandler to redirect standard library logging to loguru."""
 
 import logging
+import sys
 
 from loguru import logger as _loguru_logger
 
-from lib_logger.core import LoggerCore
+from lib_logger.core import LoggerCore, _bound_logger, _get_trace_id
+
+# Loguru level names for the standard stdlib levels, keyed by levelno.
+_LEVEL_NAMES = {
+    logging.DEBUG: "DEBUG",
+    logging.INFO: "INFO",
+    logging.WARNING: "WARNING",
+    logging.ERROR: "ERROR",
+    logging.CRITICAL: "CRITICAL",
+}
+
+_LOGGING_FILE = logging.__file__
+_getframe = sys._getframe
+
+
+def _caller_depth() -> int:
+    """Return the loguru depth of the stdlib logging call, as seen from emit().
+
+    Walks back from emit()'s caller past every frame inside the logging module.
+    """
+    frame, depth = _getframe(2), 1
+    while frame and frame.f_code.co_filename == _LOGGING_FILE:
+        frame = frame.f_back
+        depth += 1
+    return depth
 
 
 class InterceptHandler(logging.Handler):
@@ -25,29 +50,58 @@ class InterceptHandler(logging.Handler):
         logging.getLogger("uvicorn").handlers = [InterceptHandler()]
     """
 
+    # logging.Handler itself has no __slots__, so instances keep a __dict__;
+    # the slot only gives the per-record depth cache a descriptor lookup.
+    __slots__ = ("_depth",)
+
+    def __init__(self, level: int | str = logging.NOTSET):
+        """Initialize the handler.
+
+        Args:
+            level: Minimum stdlib level handled
+        """
+        super().__init__(level)
+        self._depth = 0
+
     def emit(self, record: logging.LogRecord) -> None:
         """Process a log record from stdlib logging.
 
         Args:
             record: Standard library LogRecord
         """
-        # Get corresponding loguru level
+        # No configured adapter would write this record. Returning before
+        # record.getMessage() also skips %-formatting its arguments.
+        if record.levelno < LoggerCore._min_levelno:
+            return
+
+        # Get corresponding loguru level (custom levels go through loguru)
+        level = _LEVEL_NAMES.get(record.levelno)
+        if level is None:
+            try:
+                level = _loguru_logger.level(record.levelname).name
+            except ValueError:
+                level = record.levelno
+
+        # Find caller from where the logging call was made. The stack depth is
+        # the same for most calls, so reuse the last one when its frame is the
+        # call site the record reports, and only walk the stack otherwise.
+        depth = self._depth
         try:
-            level = _loguru_logger.level(record.levelname).name
+            frame = _getframe(depth)
         except ValueError:
-            level = record.levelno
-
-        # Find caller from where the logging call was made
-        frame, depth = logging.currentframe(), 2
-        while frame and frame.f_code.co_filename == logging.__file__:
-            frame = frame.f_back
-            depth += 1
+            frame = None
+        if (
+            frame is None
+            or frame.f_lineno != record.lineno
+            or frame.f_code.co_filename != record.pathname
+        ):
+            depth = self._depth = _caller_depth()
 
         # Get current trace_id from context
-        trace_id = LoggerCore.get_trace_id()
+        trace_id = _get_trace_id() or LoggerCore.get_trace_id()
 
-        # Log to loguru with proper context including trace_id and name
-        _loguru_logger.opt(depth=depth, exception=record.exc_info).bind(
-            trace_id=trace_id,
-            name=record.name,  # Add logger name from stdlib logging
+        # Log through the logger bound to (name, trace_id) that get_logger()
+        # also reuses, so emit() does not bind and merge extras per record
+        _bound_logger(record.name, trace_id).opt(
+            depth=depth, exception=record.exc_info
         ).log(level, record.getMessage())
@@ -1,7 +1,25 @@
 """Tests for adapter system."""
 
-from lib_logger import LoggerCore, configure_logging, reset_logging
+import gc
+import io
+import json
+import logging
+import os
+import subprocess
+import sys
+import textwrap
+import time
+import weakref
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from enum import Enum
+from types import SimpleNamespace
+
+import pytest
+from lib_logger import LoggerCore, _json, configure_logging, reset_logging
 from lib_logger.adapters import ConsoleAdapter, GCPAdapter, JSONAdapter
+from lib_logger.adapters._batch import BatchingWriter
+from loguru import logger as loguru_logger
 
 
 class TestAdapters:
@@ -86,12 +104,38 @@ class TestAdapters:
         assert "{extra[trace_id]}" in sink_config["format"]
         assert "{extra[name]}" in sink_config["format"]
 
-    def test_json_adapter_serialize(self) -> None:
-        """JSONAdapter should enable serialization."""
-        adapter = JSONAdapter()
-        sink_config = adapter.get_sink_config()
+    def test_json_adapter_serialize(self, capsys: pytest.CaptureFixture[str]) -> None:
+        """JSONAdapter should emit the same payload as loguru's serialize=True."""
+        configure_logging(adapters=[JSONAdapter()])
+        reference = io.StringIO()
+        handler_id = loguru_logger.add(reference, format="{message}", serialize=True)
+
+        LoggerCore.get_logger("json_test").info("Ünïcode {count}", count=3)
+        loguru_logger.remove(handler_id)
+        reset_logging()
+
+        line = capsys.readouterr().out.strip()
+        payload = json.loads(line)
+        expected = json.loads(reference.getvalue())
+        assert payload == expected
+        assert payload["record"]["message"] == "Ünïcode 3"
+        assert payload["record"]["extra"]["name"] == "json_test"
 
-        assert sink_config.get("serialize") is True
+    def test_json_sink_batches_lines(self, capfd: pytest.CaptureFixture[str]) -> None:
+        """The JSON sink should batch lines and flush them on reset."""
+        reset_logging()
+        configure_logging(adapters=[JSONAdapter(level="INFO")])
+
+        logger = LoggerCore.get_logger("json_test")
+        logger.info("first")
+        logger.warning("second")
+        reset_logging()
+
+        lines = capfd.readouterr().out.splitlines()
+        assert [json.loads(line)["record"]["message"] for line in lines] == [
+            "first",
+            "second",
+        ]
 
     def test_gcp_adapter_custom_formatter(self) -> None:
         """GCPAdapter should use custom formatter."""
@@ -121,7 +165,7 @@ class TestAdapterSinkConfigs:
         config = adapter.get_sink_config()
 
         assert config["level"] == "DEBUG"
-        assert config["serialize"] is True
+        assert callable(config["sink"])
 
     def test_gcp_adapter_sink_config(self) -> None:
         """GCPAdapter should return valid sink config."""
@@ -139,3 +183,324 @@ class TestAdapterSinkConfigs:
             adapter = ConsoleAdapter(level=level)
             config = adapter.get_sink_config()
             assert config["level"] == level
+
+    def test_gcp_trace_id_validation(self) -> None:
+        """Only 32 lowercase hex characters should count as a GCP trace id."""
+        assert GCPAdapter._is_gcp_trace_id("0123456789abcdef" * 2)
+        assert not GCPAdapter._is_gcp_trace_id("0123456789ABCDEF" * 2)
+        assert not GCPAdapter._is_gcp_trace_id("05556afc")
+        assert not GCPAdapter._is_gcp_trace_id("0123456789abcdeg" * 2)
+        assert not GCPAdapter._is_gcp_trace_id("0123456789abcdé" + "0" * 17)
+        assert not GCPAdapter._is_gcp_trace_id("")
+
+    def test_adapter_enqueue_option(self) -> None:
+        """Adapters should pass the enqueue option through to loguru."""
+        for adapter_cls in (ConsoleAdapter, JSONAdapter, GCPAdapter):
+            assert adapter_cls().get_sink_config()["enqueue"] is False
+            assert adapter_cls(enqueue=True).get_sink_config()["enqueue"] is True
+
+    def test_adapters_use_slots(self) -> None:
+        """Built-in adapters should not carry a per-instance __dict__."""
+        for adapter_cls in (ConsoleAdapter, JSONAdapter, GCPAdapter):
+            assert not hasattr(adapter_cls(), "__dict__")
+
+    def test_adapters_accept_loguru_levels(self) -> None:
+        """Adapters should accept TRACE, SUCCESS and numeric levels."""
+        for level in ("TRACE", "SUCCESS", 5):
+            for adapter_cls in (ConsoleAdapter, JSONAdapter, GCPAdapter):
+                adapter = adapter_cls(level=level)
+                assert adapter.get_sink_config()["level"] == level
+
+        configure_logging(adapters=[ConsoleAdapter(level="TRACE")])
+        assert LoggerCore.is_configured()
+
+    def test_adapter_should_log(self) -> None:
+        """should_log should compare levels case-insensitively."""
+        adapter = ConsoleAdapter(level="warning")
+
+        assert not adapter.should_log("DEBUG")
+        assert not adapter.should_log("info")
+        assert adapter.should_log("WARNING")
+        assert adapter.should_log("critical")
+
+        assert not adapter.should_log(logging.INFO)
+        assert adapter.should_log(logging.ERROR)
+
+        adapter.level = "DEBUG"
+        assert adapter.should_log("DEBUG")
+
+    def test_adapter_should_log_trace_and_success(self) -> None:
+        """should_log should rank TRACE (5) and SUCCESS (25) like loguru."""
+        adapter = ConsoleAdapter(level="TRACE")
+        assert adapter.should_log("TRACE")
+        assert adapter.should_log(5)
+        assert adapter.should_log("DEBUG")
+
+        adapter = ConsoleAdapter(level="SUCCESS")
+        assert not adapter.should_log("INFO")
+        assert adapter.should_log("SUCCESS")
+        assert adapter.should_log("success")
+        assert adapter.should_log(25)
+        assert adapter.should_log("WARNING")
+        assert not adapter.should_log("TRACE")
+
+
+class TestGCPFormatter:
+    """Test the GCP Cloud Logging payload."""
+
+    @staticmethod
+    def _record(**extra: object) -> dict:
+        return {
+            "time": datetime(
+                2026, 2, 5, 22, 55, 32, tzinfo=timezone(timedelta(hours=1))
+            ),
+            "level": SimpleNamespace(name="SUCCESS"),
+            "message": "Request received",
+            "file": SimpleNamespace(name="main.py"),
+            "line": 42,
+            "function": "handle_request",
+            "extra": extra,
+        }
+
+    def test_gcp_formatter_payload(self) -> None:
+        """The formatter should emit GCP structured logging fields."""
+        adapter = GCPAdapter(project_id="my-project")
+        trace_id = "0123456789abcdef" * 2
+
+        payload = json.loads(
+            adapter._gcp_formatter(
+                self._record(trace_id=trace_id, name="api", user_id="user_123")
+            )
+        )
+
+        assert payload == {
+            "severity": "INFO",
+            "message": "Request received",
+            "timestamp": "2026-02-05T21:55:32.000000Z",
+            "logging.googleapis.com/sourceLocation": {
+                "file": "main.py",
+                "line": 42,
+                "function": "handle_request",
+            },
+            "trace_id": trace_id,
+            "logging.googleapis.com/trace": f"projects/my-project/traces/{trace_id}",
+            "logger": "api",
+            "user_id": "user_123",
+        }
+
+    def test_gcp_sink_writes_json_lines(
+        self, capfd: pytest.CaptureFixture[str]
+    ) -> None:
+        """The sink should write one JSON object per line to stdout."""
+        reset_logging()
+        configure_logging(adapters=[GCPAdapter(level="INFO")])
+
+        logger = LoggerCore.get_logger("gcp_test")
+        logger.info("first")
+        logger.warning("second")
+        reset_logging()
+
+        lines = capfd.readouterr().out.splitlines()
+        assert [json.loads(line)["message"] for line in lines] == ["first", "second"]
+
+    def test_sinks_keep_values_orjson_rejects(
+        self, capfd: pytest.CaptureFixture[str]
+    ) -> None:
+        """Non-str dict keys and ints over 64 bits should still be logged."""
+        for adapter in (JSONAdapter(level="INFO"), GCPAdapter(level="INFO")):
+            reset_logging()
+            configure_logging(adapters=[adapter])
+
+            logger = LoggerCore.get_logger("json_values_test")
+            logger.info("keys", data={1: "a"})
+            logger.info("wide", big=2**70)
+            reset_logging()
+
+            lines = [json.loads(line) for line in capfd.readouterr().out.splitlines()]
+            if isinstance(adapter, JSONAdapter):
+                lines = [line["record"]["extra"] for line in lines]
+            assert lines[0]["data"] == {"1": "a"}
+            assert lines[1]["big"] == 2**70
+
+    def test_orjson_matches_stdlib_for_default_types(self) -> None:
+        """Datetimes and dataclasses should go through ``default`` like the stdlib."""
+
+        @dataclass
+        class Point:
+            x: int
+
+        class Color(Enum):
+            RED = 1
+
+        value = {"when": datetime(2026, 1, 2, 3, 4, 5), "point": Point(1)}
+        expected = {"when": "2026-01-02 03:04:05", "point": str(Point(1))}
+        for dumps in (_json._orjson_dumps, _json._stdlib_dumps):
+            assert json.loads(dumps(value)) == expected
+
+        # Enum members are the one documented difference.
+        assert json.loads(_json._orjson_dumps(Color.RED)) == 1
+        assert json.loads(_json._stdlib_dumps(Color.RED)) == "Color.RED"
+
+    def test_gcp_sink_writes_errors_immediately(
+        self, capfd: pytest.CaptureFixture[str]
+    ) -> None:
+        """ERROR lines should not wait in the batch."""
+        reset_logging()
+        configure_logging(adapters=[GCPAdapter(level="INFO", batch_ms=60_000)])
+
+        logger = LoggerCore.get_logger("gcp_test")
+        logger.info("first")
+        logger.error("second")
+
+        lines = capfd.readouterr().out.splitlines()
+        assert [json.loads(line)["message"] for line in lines] == ["first", "second"]
+        reset_logging()
+
+    def test_gcp_enqueued_sink_drops_below_level(
+        self, capfd: pytest.CaptureFixture[str]
+    ) -> None:
+        """Below-level records should never reach an enqueued sink."""
+        reset_logging()
+        configure_logging(
+            adapters=[GCPAdapter(level="WARNING", enqueue=True, batch_bytes=0)]
+        )
+
+        logger = LoggerCore.get_logger("gcp_queue_test")
+        logger.info("dropped")
+        logger.warning("kept")
+        reset_logging()
+
+        lines = capfd.readouterr().out.splitlines()
+        assert [json.loads(line)["message"] for line in lines] == ["kept"]
+
+
+class TestBatchingWriter:
+    """Test the batched stream writer used by the JSON and GCP adapters."""
+
+    def setup_method(self) -> None:
+        """Open a non-blocking pipe and a text stream to write into it."""
+        self.read_fd, self.write_fd = os.pipe()
+        os.set_blocking(self.read_fd, False)
+        self.stream = open(self.write_fd, "w", closefd=False)
+
+    def teardown_method(self) -> None:
+        """Close the stream and the pipe."""
+        self.stream.close()
+        os.close(self.read_fd)
+        os.close(self.write_fd)
+
+    def _read(self) -> bytes:
+        try:
+            return os.read(self.read_fd, 65536)
+        except BlockingIOError:
+            return b""
+
+    def test_buffers_until_flush(self) -> None:
+        """Lines should stay buffered until flushed."""
+        writer = BatchingWriter(self.stream, max_bytes=1024, max_ms=60_000)
+        writer.write(b"first\n")
+        writer.write(b"second\n")
+        assert self._read() == b""
+
+        writer.flush()
+        assert self._read() == b"first\nsecond\n"
+
+    def test_flushes_when_full(self) -> None:
+        """Reaching max_bytes should flush immediately."""
+        writer = BatchingWriter(self.stream, max_bytes=8, max_ms=60_000)
+        writer.write(b"1234\n")
+        writer.write(b"5678\n")
+        assert self._read() == b"1234\n5678\n"
+
+    def test_urgent_write_flushes(self) -> None:
+        """Urgent lines should flush the whole batch immediately."""
+        writer = BatchingWriter(self.stream, max_bytes=1024, max_ms=60_000)
+        writer.write(b"info\n")
+        writer.write(b"error\n", urgent=True)
+        assert self._read() == b"info\nerror\n"
+
+    def test_unused_writers_are_collected(self) -> None:
+        """The exit hook should not keep writers alive."""
+        writer = BatchingWriter(self.stream)
+        ref = weakref.ref(writer)
+        del writer
+        gc.collect()
+        assert ref() is None
+
+    def test_stays_in_order_with_stream_text(self) -> None:
+        """Text already written to the stream should come out first."""
+        writer = BatchingWriter(self.stream, max_bytes=1024, max_ms=60_000)
+        self.stream.write("printed\n")
+        writer.write(b"logged\n")
+        writer.flush()
+        assert self._read() == b"printed\nlogged\n"
+
+    def test_writes_text_to_streams_without_buffer(self) -> None:
+        """Streams with no binary buffer should receive decoded text."""
+        stream = io.StringIO()
+        writer = BatchingWriter(stream, max_bytes=1024, max_ms=60_000)
+        writer.write("Ünïcode\n".encode())
+        writer.flush()
+        assert stream.getvalue() == "Ünïcode\n"
+
+    @pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork")
+    def test_forked_child_starts_with_empty_buffer(self) -> None:
+        """A forked child should flush its own lines, not the parent's."""
+        writer = BatchingWriter(self.stream, max_bytes=1024, max_ms=10)
+        writer.write(b"parent\n")
+
+        pid = os.fork()
+        if pid == 0:
+            try:
+                writer.write(b"child\n")
+                time.sleep(0.3)
+            finally:
+                os._exit(0)
+        os.waitpid(pid, 0)
+        writer.flush()
+
+        # The child's timer wrote its line; the parent's line is written once
+        data = self._read()
+        assert sorted(data.splitlines()) == [b"child", b"parent"]
+
+    def test_flushes_after_interval(self) -> None:
+        """Buffered lines should be written once max_ms has elapsed."""
+        writer = BatchingWriter(self.stream, max_bytes=1024, max_ms=10)
+        writer.write(b"late\n")
+
+        deadline = time.monotonic() + 2
+        data = b""
+        while not data and time.monotonic() < deadline:
+            time.sleep(0.01)
+            data = self._read()
+        assert data == b"late\n"
+
+
+class TestBatchingAtExit:
+    """Test that batched output survives interpreter exit."""
+
+    def test_enqueued_lines_are_written_at_exit(self) -> None:
+        """Records still queued by loguru at exit should reach stdout."""
+        script = textwrap.dedent(
+            """
+            from lib_logger import LoggerCore, configure_logging
+            from lib_logger.adapters import GCPAdapter
+
+            configure_logging(adapters=[GCPAdapter(level="INFO", enqueue=True)])
+            logger = LoggerCore.get_logger("exit_test")
+            for i in range(5000):
+                logger.info("line {i}", i=i)
+            """
+        )
+        src = os.path.join(os.path.dirname(os.path.dirname(__file__)), "src")
+        env = {**os.environ, "PYTHONPATH": src}
+
+        result = subprocess.run(
+            [sys.executable, "-c", script],
+            capture_output=True,
+            env=env,
+            check=True,
+            timeout=60,
+        )
+
+        assert len(result.stdout.splitlines()) == 5000
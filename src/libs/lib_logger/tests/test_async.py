@@ -40,6 +40,16 @@ class TestAsyncTraceIDs:
         assert original != new
         assert len(new) == 8
 
+    def test_reset_trace_id_secure(self) -> None:
+        """reset_trace_id(secure=True) should also produce 8 hex characters."""
+        original = LoggerCore.get_trace_id()
+        LoggerCore.reset_trace_id(secure=True)
+        new = LoggerCore.get_trace_id()
+
+        assert original != new
+        assert len(new) == 8
+        int(new, 16)
+
     @pytest.mark.asyncio
     async def test_async_isolation(self) -> None:
         """Each async task should have isolated trace ID."""
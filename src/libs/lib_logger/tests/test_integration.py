@@ -79,6 +79,17 @@ class TestLoggingConfiguration:
                 isinstance(h, InterceptHandler) for h in uvicorn_logger.handlers
             )
 
+    def test_configure_reuses_intercept_handler(self) -> None:
+        """Repeated configuration should keep a single shared InterceptHandler."""
+        configure_logging(stdlib_loggers=["reused_a", "reused_b"])
+        reset_logging()
+        configure_logging(stdlib_loggers=["reused_a", "reused_b"])
+
+        handlers_a = logging.getLogger("reused_a").handlers
+        handlers_b = logging.getLogger("reused_b").handlers
+        assert len(handlers_a) == 1
+        assert handlers_a[0] is handlers_b[0]
+
     def test_custom_stdlib_loggers(self) -> None:
         """Should intercept only specified stdlib loggers."""
         configure_logging(intercept_stdlib=True, stdlib_loggers=["custom_logger"])
@@ -124,6 +135,76 @@ class TestInterceptHandler:
         stdlib_logger.warning("Warning message")
         stdlib_logger.error("Error message")
 
+    def test_intercepthandler_skips_records_below_adapter_levels(self) -> None:
+        """Records below every adapter's level should not reach loguru."""
+        from loguru import logger as loguru_logger
+
+        reset_logging()
+        configure_logging(adapters=[ConsoleAdapter(level="ERROR")])
+        records = []
+        sink_id = loguru_logger.add(records.append, format="{message}")
+        stdlib_logger = logging.getLogger("test_min_level")
+        stdlib_logger.handlers = [InterceptHandler()]
+        stdlib_logger.propagate = False
+
+        try:
+            stdlib_logger.warning("dropped")
+            stdlib_logger.error("kept")
+        finally:
+            loguru_logger.remove(sink_id)
+
+        assert [message.record["message"] for message in records] == ["kept"]
+
+    def test_intercepthandler_does_not_format_dropped_records(self) -> None:
+        """%-style arguments of dropped records should never be formatted."""
+        reset_logging()
+        configure_logging(adapters=[ConsoleAdapter(level="ERROR")])
+        formatted = []
+
+        class Argument:
+            def __str__(self) -> str:
+                formatted.append(self)
+                return "argument"
+
+        handler = InterceptHandler()
+        record = logging.LogRecord(
+            name="test",
+            level=logging.INFO,
+            pathname="test.py",
+            lineno=1,
+            msg="Value: %s",
+            args=(Argument(),),
+            exc_info=None,
+        )
+        handler.emit(record)
+
+        assert formatted == []
+
+    def test_intercepthandler_reports_caller(self) -> None:
+        """Intercepted records should point at the stdlib logging call site."""
+        from loguru import logger as loguru_logger
+
+        records = []
+        sink_id = loguru_logger.add(records.append, format="{message}")
+        stdlib_logger = logging.getLogger("test_caller")
+        stdlib_logger.handlers = [InterceptHandler()]
+        stdlib_logger.propagate = False
+
+        try:
+            stdlib_logger.warning("first")
+            stdlib_logger.error("second")
+            try:
+                raise ValueError("Test error")
+            except ValueError:
+                stdlib_logger.exception("third")
+        finally:
+            loguru_logger.remove(sink_id)
+
+        assert len(records) == 3
+        for message in records:
+            assert message.record["function"] == "test_intercepthandler_reports_caller"
+            assert message.record["file"].path == __file__
+
     def test_intercepthandler_with_exception(self) -> None:
         """InterceptHandler should handle exceptions in log records."""
         handler = InterceptHandler()
@@ -180,6 +261,33 @@ class TestLoggerCore:
         logger.error("Error message")
         logger.critical("Critical message")
 
+    def test_get_logger_reuses_bound_logger(self) -> None:
+        """get_logger should reuse the bound logger per name and trace ID."""
+        LoggerCore.set_trace_id("cache001")
+        logger = LoggerCore.get_logger("cached")
+
+        assert LoggerCore.get_logger("cached") is logger
+        assert LoggerCore.get_logger("other") is not logger
+
+        LoggerCore.set_trace_id("cache002")
+        assert LoggerCore.get_logger("cached") is not logger
+
+        LoggerCore.reset_trace_id()
+
+    def test_reset_for_tests_reuses_adapters(self) -> None:
+        """reset_for_tests should keep the adapters for the next configure."""
+        configure_logging()
+        adapters = LoggerCore.get_adapters()
+        LoggerCore.set_trace_id("keep0001")
+
+        LoggerCore.reset_for_tests()
+
+        assert not LoggerCore.is_configured()
+        assert LoggerCore.get_trace_id() != "keep0001"
+        LoggerCore.get_logger("test")
+        assert LoggerCore.is_configured()
+        assert LoggerCore.get_adapters() is adapters
+
     def test_logger_with_extra_data(self) -> None:
         """Logger should accept extra data."""
         logger = LoggerCore.get_logger("test")